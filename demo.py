@@ -8,43 +8,18 @@ import os
 import sys
 import time
 import tempfile
-import subprocess
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from storage.database import Database
-from utils.config import Config
-from summarizer.llm_summarizer import LLMSummarizer
-
-
-def check_ollama():
-    """Check if Ollama is available."""
-    try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except:
-        return False
+from onloq.storage.database import Database
+from onloq.utils.config import Config
+from onloq.summarizer.llm_summarizer import LLMSummarizer, check_ollama
 
 
 def demo_database():
     """Demo database functionality."""
     print("🗄️  Testing database functionality...")
     
-    # Create temporary database
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
-    
-    try:
-        db = Database(db_path)
-        db.initialize()
-        
+    # In-memory database, nothing touches the disk
+    with Database(":memory:") as db:
         # Add some sample data
         db.log_activity(
             event_type="app_focus",
@@ -70,30 +45,19 @@ def demo_database():
         stats = db.get_recent_stats()
         print(f"   ✅ Database created successfully")
         print(f"   📊 Sample stats: {stats}")
-        
-        db.close()
-        
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
 
 
 def demo_config():
     """Demo configuration functionality."""
     print("⚙️  Testing configuration...")
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        config_path = f.name
-    
-    try:
+    # Removed with the directory, even if the demo fails
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "onloq_config.json")
         config = Config(config_path)
         print(f"   ✅ Config created at: {config_path}")
         print(f"   📁 Watch dirs: {config.get_watch_directories()}")
         print(f"   📄 File extensions: {len(config.get_file_extensions())} types")
-        
-    finally:
-        if os.path.exists(config_path):
-            os.unlink(config_path)
 
 
 def demo_summarizer():
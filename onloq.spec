@@ -13,25 +13,25 @@ a = Analysis(
         (os.path.join(current_dir, 'icon.png'), '.'),
     ],
     hiddenimports=[
-        'cli',
-        'cli.main',
-        'logger',
-        'logger.activity_logger',
-        'logger.code_logger',
-        'storage',
-        'storage.database',
-        'summarizer',
-        'summarizer.llm_summarizer',
-        'scheduler',
-        'scheduler.daily_scheduler',
-        'scheduler.notifier',
-        'utils',
-        'utils.config',
+        'onloq',
+        'onloq.cli',
+        'onloq.cli.main',
+        'onloq.logger',
+        'onloq.logger.activity_logger',
+        'onloq.logger.code_logger',
+        'onloq.storage',
+        'onloq.storage.database',
+        'onloq.summarizer',
+        'onloq.summarizer.llm_summarizer',
+        'onloq.scheduler',
+        'onloq.scheduler.daily_scheduler',
+        'onloq.scheduler.notifier',
+        'onloq.utils',
+        'onloq.utils.config',
         'typer',
         'rich',
         'psutil',
         'watchdog',
-        'pynput',
         'win32gui',
         'win32process',
         'win32con',
@@ -2,9 +2,9 @@ import win32serviceutil
 import win32service
 import win32event
 import servicemanager
-import os
-import sys
-import subprocess
+import threading
+
+from onloq.cli.main import app, request_stop
 
 class OnloqService(win32serviceutil.ServiceFramework):
     _svc_name_ = "OnloqService"
@@ -14,13 +14,13 @@ class OnloqService(win32serviceutil.ServiceFramework):
     def __init__(self, args):
         win32serviceutil.ServiceFramework.__init__(self, args)
         self.hWaitStop = win32event.CreateEvent(None, 0, 0, None)
-        self.process = None
+        self.logger_thread = None
 
     def SvcStop(self):
         self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
+        # Let the logger shut down gracefully so pending writes are flushed
+        request_stop()
         win32event.SetEvent(self.hWaitStop)
-        if self.process:
-            self.process.terminate()
 
     def SvcDoRun(self):
         servicemanager.LogMsg(
@@ -32,11 +32,23 @@ class OnloqService(win32serviceutil.ServiceFramework):
         self.main()
 
     def main(self):
-        executable = sys.executable
-        script_path = os.path.join(os.path.dirname(__file__), "main.py")
-        self.process = subprocess.Popen([executable, script_path, "run", "--daemon"], shell=False)
+        # Run the logger in this process instead of spawning a second interpreter
+        self.logger_thread = threading.Thread(
+            target=app,
+            kwargs={"args": ["run", "--daemon"], "prog_name": "onloq", "standalone_mode": False},
+            daemon=True
+        )
+        self.logger_thread.start()
         win32event.WaitForSingleObject(self.hWaitStop, win32event.INFINITE)
+        self.logger_thread.join(timeout=30)
+
+def start():
+    """Start the installed service, like `onloq_service.py start`."""
+    win32serviceutil.StartService(OnloqService._svc_name_)
+
+def stop():
+    """Stop the running service, like `onloq_service.py stop`."""
+    win32serviceutil.StopService(OnloqService._svc_name_)
 
 if __name__ == '__main__':
     win32serviceutil.HandleCommandLine(OnloqService)
-
@@ -0,0 +1,78 @@
+"""
+Micro-benchmarks for the Onloq database write path
+
+Every speed_* function gets a fresh database from setup(), so only the
+logging calls are timed, not opening the connection or creating the schema.
+
+Run with: python perf/speed_db.py
+"""
+
+import time
+
+from onloq.storage.database import Database
+
+ROWS = 1000
+REPEAT = 5
+
+
+def setup() -> Database:
+    """Open an initialized in-memory database."""
+    db = Database(":memory:")
+    db.initialize()
+    return db
+
+
+def speed_log_activity(db: Database):
+    """Queue single activity events and wait for the writer to commit them."""
+    for i in range(ROWS):
+        db.log_activity(event_type="app_focus", application=f"app_{i}",
+                        window_title="Window", duration_seconds=5)
+    db.flush()
+
+
+def speed_log_activity_transaction(db: Database):
+    """Log single activity events inside one transaction and wait for its commit."""
+    with db.transaction():
+        for i in range(ROWS):
+            db.log_activity(event_type="app_focus", application=f"app_{i}",
+                            window_title="Window", duration_seconds=5)
+    db.flush()
+
+
+def speed_log_activity_many(db: Database):
+    """Log activity events through the bulk API and wait for their commit."""
+    db.log_activity_many(
+        {"event_type": "app_focus", "application": f"app_{i}",
+         "window_title": "Window", "duration_seconds": 5}
+        for i in range(ROWS)
+    )
+    db.flush()
+
+
+def speed_log_code_change(db: Database):
+    """Queue single code changes and wait for the writer to commit them."""
+    for i in range(ROWS):
+        db.log_code_change(file_path=f"src/file_{i}.py", change_type="modified",
+                           file_size=1024, diff_content="-old\n+new")
+    db.flush()
+
+
+def main():
+    benchmarks = [(name, func) for name, func in globals().items()
+                  if name.startswith("speed_") and callable(func)]
+    
+    for name, func in benchmarks:
+        timings = []
+        for _ in range(REPEAT):
+            db = setup()
+            start = time.perf_counter()
+            func(db)
+            timings.append(time.perf_counter() - start)
+            db.close()
+        
+        best = min(timings)
+        print(f"{name:<32} {best * 1000:8.2f} ms  {best / ROWS * 1e6:6.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Entry point for ``python -m onloq``
+"""
+
+from onloq.cli.main import app
+
+if __name__ == "__main__":
+    app(prog_name="onloq")
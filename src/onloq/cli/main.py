@@ -0,0 +1,437 @@
+"""
+Main CLI interface for Onloq
+"""
+
+import typer
+from pathlib import Path
+import atexit
+import contextlib
+import functools
+import io
+import threading
+import signal
+import sys
+from datetime import date
+from typing import TYPE_CHECKING
+
+from onloq.utils.config import Config
+
+# Heavier modules (rich, watchdog, psutil, schedule, ...) are imported by the
+# commands that need them so that `onloq status` and `--help` start quickly
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from onloq.storage.database import Database
+
+app = typer.Typer(name="onloq", help="Privacy-first local activity and code change logger")
+
+# Set to shut down a running `run` command, e.g. from the Windows service
+_stop_event = threading.Event()
+
+
+# Named Windows event that other processes can signal to stop `run`
+WINDOWS_STOP_EVENT_NAME = "Local\\OnloqStop"
+
+
+def request_stop():
+    """Ask a running `run` command to shut down gracefully."""
+    _stop_event.set()
+
+
+@contextlib.contextmanager
+def _windows_stop_sources():
+    """Forward Windows stop requests to request_stop() while active.
+    
+    Ctrl+C and the named stop event are delivered on the system thread
+    pool through SetConsoleCtrlHandler and RegisterWaitForSingleObject, so
+    the main thread can block in one untimed wait instead of polling.
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    INFINITE = 0xFFFFFFFF
+    WT_EXECUTEONLYONCE = 0x00000008
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1)
+    
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    kernel32.CreateEventW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR)
+    
+    WaitOrTimerCallback = ctypes.WINFUNCTYPE(None, wintypes.LPVOID, wintypes.BOOLEAN)
+    HandlerRoutine = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.DWORD)
+    
+    @WaitOrTimerCallback
+    def on_stop_event(context, timed_out):
+        request_stop()
+    
+    @HandlerRoutine
+    def on_console_ctrl(ctrl_type):
+        request_stop()
+        # Not handled, so Python's own handler still runs the SIGINT handler
+        return False
+    
+    stop_handle = kernel32.CreateEventW(None, True, False, WINDOWS_STOP_EVENT_NAME)
+    if not stop_handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    wait_handle = wintypes.HANDLE()
+    try:
+        if not kernel32.RegisterWaitForSingleObject(
+            ctypes.byref(wait_handle), wintypes.HANDLE(stop_handle), on_stop_event,
+            None, INFINITE, WT_EXECUTEONLYONCE
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+        kernel32.SetConsoleCtrlHandler(on_console_ctrl, True)
+        try:
+            yield
+        finally:
+            kernel32.SetConsoleCtrlHandler(on_console_ctrl, False)
+            # Waits for a running callback before the ctypes thunks go away
+            kernel32.UnregisterWaitEx(wait_handle, INVALID_HANDLE_VALUE)
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(stop_handle))
+
+
+def _wait_for_stop():
+    """Block until request_stop() is called or a stop signal arrives."""
+    with contextlib.ExitStack() as stack:
+        poll_interval = None
+        if sys.platform == "win32":
+            try:
+                stack.enter_context(_windows_stop_sources())
+            except OSError:
+                # Without the callbacks Ctrl+C can't interrupt an untimed wait
+                poll_interval = 1
+        while not _stop_event.wait(poll_interval):
+            pass
+
+
+@functools.cache
+def _console() -> "Console":
+    """Get the shared rich console."""
+    from rich.console import Console
+    return Console()
+
+
+# Title and style of the header panel shown by each command
+_BANNERS = {
+    "init": ("🔒 Initializing Onloq", "bold blue"),
+    "run": ("🚀 Starting Onloq Logger", "bold green"),
+    "summarize": ("🤖 Generating Summary with AI", "bold magenta"),
+    "status": ("📊 Onloq Status", "bold blue"),
+    "auto": ("⚙️ Configuring Auto-Summarization", "bold cyan"),
+    "schedule": ("📅 Schedule Status", "bold blue"),
+}
+
+
+@functools.cache
+def _banner(command: str) -> "Panel":
+    """Get the header panel for a command, built once per process."""
+    from rich.panel import Panel
+    title, style = _BANNERS[command]
+    return Panel.fit(title, style=style)
+
+
+@functools.lru_cache(maxsize=1)
+def get_db() -> "Database":
+    """Get the database connection shared by every command in this process."""
+    from onloq.storage.database import Database
+    
+    db = Database()
+    db.initialize()
+    atexit.register(db.close)
+    return db
+
+
+@app.command()
+def init(
+    config_path: str = typer.Option("./onloq_config.json", help="Path to config file"),
+    watch_dirs: str = typer.Option(".", help="Comma-separated directories to watch for code changes")
+):
+    """Initialize Onloq configuration and setup tracking folders."""
+    console = _console()
+    
+    console.print(_banner("init"))
+    
+    config = Config(config_path)
+    
+    # Setup watch directories (resolved and de-duplicated, order preserved)
+    dirs = list(dict.fromkeys(
+        str(Path(d.strip()).resolve()) for d in watch_dirs.split(",") if d.strip()
+    ))
+    config.set_watch_directories(dirs)
+    config.save()
+    
+    # Initialize database
+    get_db()
+    
+    console.print("\n".join([
+        f"✅ Configuration saved to: {config_path}",
+        f"📁 Watching directories: {', '.join(dirs)}",
+        "🎯 Run 'python main.py run' to start logging",
+    ]))
+
+@app.command()
+def run(
+    config_path: str = typer.Option("./onloq_config.json", help="Path to config file"),
+    daemon: bool = typer.Option(False, help="Run in daemon mode (background)"),
+    auto_summarize: bool = typer.Option(None, help="Enable/disable automatic daily summaries")
+):
+    """Start the activity and code loggers with optional automatic summarization."""
+    from concurrent.futures import ThreadPoolExecutor
+    from onloq.logger.activity_logger import ActivityLogger
+    from onloq.logger.code_logger import CodeLogger
+    from onloq.scheduler.daily_scheduler import DailyScheduler
+    console = _console()
+    
+    console.print(_banner("run"))
+    
+    config = Config(config_path)
+    
+    # Update auto-summarize setting if provided
+    if auto_summarize is not None:
+        config.update_summarization_settings(auto_summarize=auto_summarize)
+        config.save()
+        console.print(f"📅 Auto-summarization: {'enabled' if auto_summarize else 'disabled'}")
+    
+    # Initialize components
+    db = get_db()
+    activity_logger = ActivityLogger(db)
+    code_logger = CodeLogger(db, config.get_watch_directories())
+    daily_scheduler = DailyScheduler(config, db)
+    
+    # Setup signal handlers for graceful shutdown. Signals can only be
+    # handled on the main thread; embedders call request_stop() instead.
+    def signal_handler(signum, frame):
+        console.print("\n🛑 Shutting down gracefully...")
+        request_stop()
+    
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+    
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="onloq")
+    loggers = {"Activity logger": activity_logger.start, "Code logger": code_logger.start}
+    failed = []
+    
+    def report_failure(name, future):
+        # Report a logger that died as soon as it happens, the other keeps running
+        if future.cancelled() or not future.exception():
+            return
+        console.print(f"❌ {name} failed: {future.exception()}", style="bold red")
+        failed.append(name)
+        if len(failed) == len(loggers):
+            request_stop()
+    
+    try:
+        # Start loggers on worker threads
+        for name, start in loggers.items():
+            future = executor.submit(start)
+            future.add_done_callback(functools.partial(report_failure, name))
+        
+        # Start daily scheduler
+        daily_scheduler.start()
+        
+        for name, message in (("Activity logger", "📊 Activity logging started"),
+                              ("Code logger", "📝 Code change monitoring started")):
+            if name not in failed:
+                console.print(message)
+        
+        # Show scheduler status
+        if config.get_summarization_settings().get("auto_summarize", False):
+            next_run = daily_scheduler.get_next_run_time()
+            if next_run:
+                console.print(f"📅 Next summary scheduled: {next_run}")
+            console.print("🔔 Desktop notifications enabled")
+        else:
+            console.print("📅 Auto-summarization disabled (use --auto-summarize to enable)")
+        
+        console.print("Press Ctrl+C to stop")
+        
+        # Block until a shutdown signal arrives
+        _wait_for_stop()
+                    
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="bold red")
+    finally:
+        activity_logger.stop()
+        code_logger.stop()
+        daily_scheduler.stop()
+        executor.shutdown(wait=True, cancel_futures=True)
+        
+        db.flush()
+        _stop_event.clear()
+    
+    if len(failed) == len(loggers):
+        raise typer.Exit(code=1)
+
+@app.command()
+def summarize(
+    config_path: str = typer.Option("./onloq_config.json", help="Path to config file"),
+    days: int = typer.Option(1, help="Number of days to summarize"),
+    model: str = typer.Option("qwen2.5", help="Ollama model to use"),
+    output_file: str = typer.Option("", help="Output file for summary (optional)")
+):
+    """Generate AI summary of logged data."""
+    from rich.live import Live
+    from rich.panel import Panel
+    from onloq.summarizer.llm_summarizer import LLMSummarizer, summary_filename
+    console = _console()
+    
+    console.print(_banner("summarize"))
+    
+    db = get_db()
+    summarizer = LLMSummarizer(model=model)
+    
+    try:
+        # Fix the date up front so a summary that finishes after midnight
+        # is still filed under the day it covers
+        summary_date = date.today()
+        chunks = summarizer.stream_summary(db, days=days, summary_date=summary_date)
+        
+        # Save to the default daily summary file and the output file (if
+        # specified), writing only once when both are the same path
+        default_file = summary_filename(summary_date)
+        paths = list({Path(p).resolve(): p for p in (default_file, output_file) if p}.values())
+        
+        # Show and save the summary while the model is still generating it
+        summary = io.StringIO()
+        try:
+            with contextlib.ExitStack() as stack:
+                files = [stack.enter_context(open(p, "w", encoding="utf-8")) for p in paths]
+                # Live only redraws on terminals, elsewhere print the panel once done
+                live = None
+                if console.is_terminal:
+                    live = stack.enter_context(Live(
+                        Panel("", title="📋 Daily Summary", style="cyan"),
+                        console=console,
+                        vertical_overflow="visible"
+                    ))
+                for chunk in chunks:
+                    summary.write(chunk)
+                    for f in files:
+                        f.write(chunk)
+                    if live is not None:
+                        live.update(Panel(summary.getvalue(), title="📋 Daily Summary", style="cyan"))
+            if live is None:
+                console.print(Panel(summary.getvalue(), title="📋 Daily Summary", style="cyan"))
+        except BaseException:
+            # Don't leave a truncated summary behind
+            for p in paths:
+                Path(p).unlink(missing_ok=True)
+            raise
+        
+        if output_file:
+            console.print(f"💾 Summary saved to: {output_file}")
+        console.print(f"📄 Summary also saved to: {default_file}")
+        
+    except Exception as e:
+        console.print(f"❌ Error generating summary: {e}", style="bold red")
+
+@app.command()
+def status():
+    """Show current status and recent activity."""
+    console = _console()
+    
+    console.print(_banner("status"))
+    
+    db = get_db()
+    
+    try:
+        # Get recent activity stats
+        stats = db.get_recent_stats()
+        
+        console.print("\n".join([
+            f"📱 Applications tracked today: {stats.get('apps_today', 0)}",
+            f"🌐 Websites visited today: {stats.get('websites_today', 0)}",
+            f"📝 Code files changed today: {stats.get('files_today', 0)}",
+            f"⏱️  Total active time today: {stats.get('active_time', 'Unknown')}",
+        ]))
+        
+    except Exception as e:
+        console.print(f"❌ Error getting status: {e}", style="bold red")
+
+@app.command()
+def auto(
+    config_path: str = typer.Option("./onloq_config.json", help="Path to config file"),
+    enable: bool = typer.Option(True, help="Enable auto-summarization"),
+    time: str = typer.Option("23:59", help="Time to generate summary (HH:MM format)"),
+    model: str = typer.Option("qwen2.5", help="Default model for summaries")
+):
+    """Configure automatic daily summarization."""
+    console = _console()
+    
+    console.print(_banner("auto"))
+    
+    config = Config(config_path)
+    
+    # Update settings, only rewriting the file if something changed
+    config.update_summarization_settings(auto_summarize=enable, summarize_time=time, default_model=model)
+    config.save()
+    
+    if enable:
+        console.print("\n".join([
+            "✅ Auto-summarization enabled",
+            f"⏰ Daily summary at: {time}",
+            f"🤖 Using model: {model}",
+            "🔔 Desktop notifications will be sent",
+        ]))
+    else:
+        console.print("❌ Auto-summarization disabled")
+    
+    console.print("💡 Restart Onloq for changes to take effect")
+
+@app.command()
+def schedule(
+    config_path: str = typer.Option("./onloq_config.json", help="Path to config file")
+):
+    """Show current schedule and automation status."""
+    from onloq.scheduler.daily_scheduler import DailyScheduler
+    console = _console()
+    
+    console.print(_banner("schedule"))
+    
+    config = Config(config_path)
+    settings = config.get_summarization_settings()
+    
+    auto_enabled = settings.get("auto_summarize", False)
+    summary_time = settings.get("summarize_time", "23:59")
+    model = settings.get("default_model", "qwen2.5")
+    
+    if auto_enabled:
+        console.print("\n".join([
+            "✅ Auto-summarization: ENABLED",
+            f"⏰ Summary time: {summary_time}",
+            f"🤖 Model: {model}",
+        ]))
+        
+        # Try to get next run time if scheduler is running
+        try:
+            scheduler = DailyScheduler(config)
+            next_run = scheduler.get_next_run_time()
+            if next_run:
+                console.print(f"📅 Next run: {next_run}")
+        except:
+            pass
+    else:
+        console.print("❌ Auto-summarization: DISABLED\n💡 Use 'python main.py auto --enable' to enable")
+
+@app.command()
+def notify(
+    test: bool = typer.Option(False, help="Send test notification")
+):
+    """Test notification system or send custom notifications."""
+    from onloq.scheduler.notifier import Notifier
+    console = _console()
+    
+    notifier = Notifier()
+    
+    if test:
+        console.print("🧪 Sending test notification...")
+        notifier.test_notification()
+        console.print("✅ Test notification sent!")
+    else:
+        console.print("🔔 Notification system ready\n💡 Use --test to send a test notification")
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,420 @@
+"""
+Activity logger for tracking applications, websites, and system events
+"""
+
+import time
+import threading
+import psutil
+import re
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlparse
+
+try:
+    import win32gui
+    import win32process
+    import win32con
+    WINDOWS_SUPPORT = True
+except ImportError:
+    WINDOWS_SUPPORT = False
+
+if WINDOWS_SUPPORT:
+    import ctypes
+    from ctypes import wintypes
+    
+    # WinEvent hook callback and the events it listens for
+    WinEventProc = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+    )
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    EVENT_OBJECT_NAMECHANGE = 0x800C
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    OBJID_WINDOW = 0
+    CHILDID_SELF = 0
+    WM_QUIT = 0x0012
+    WM_TIMER = 0x0113
+    WM_USER = 0x0400
+    PM_NOREMOVE = 0x0000
+    
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", wintypes.UINT), ("dwTime", wintypes.DWORD)]
+    
+    def _get_idle_seconds() -> Optional[float]:
+        """Get the seconds since the last keyboard or mouse input, system wide."""
+        info = LASTINPUTINFO(cbSize=ctypes.sizeof(LASTINPUTINFO))
+        if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+            return None
+        # Tick counts are 32-bit milliseconds that wrap every ~49.7 days
+        return ((ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000
+
+# Windows reports the time of the last input itself, so the global input
+# hooks are only installed on other platforms
+PYNPUT_SUPPORT = False
+if not WINDOWS_SUPPORT:
+    try:
+        from pynput import mouse, keyboard
+        PYNPUT_SUPPORT = True
+    except ImportError:
+        pass
+
+from onloq.storage.database import Database
+from onloq.utils.config import Config
+
+# Browsers whose window titles are scanned for a website domain
+BROWSERS = frozenset({"chrome.exe", "firefox.exe", "msedge.exe", "safari.exe", "opera.exe", "brave.exe"})
+
+# Patterns for extracting domains from browser titles, compiled once because
+# they run on every foreground window poll. A full URL anywhere in the title
+# wins over a bare domain before it.
+_URL_RE = re.compile(r"https?://([^/\s]+)")
+_DOMAIN_RE = re.compile(r"[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_WWW_PREFIX = re.compile(r"^www\.")
+
+class ActivityLogger:
+    # Processes whose names are remembered, see _get_process_name
+    PROCESS_NAME_CACHE_SIZE = 256
+    
+    # On Windows focus changes arrive as events, so the loop only wakes up
+    # this often (in seconds) to check for idle time
+    IDLE_CHECK_INTERVAL = 60
+    
+    def __init__(self, database: Database):
+        self.db = database
+        self.config = Config()
+        self.settings = self.config.get_activity_settings()
+        
+        self.running = False
+        self._stop_event = threading.Event()
+        self._loop_thread_id = None
+        self.last_activity_time = time.time()
+        # Focused window as (app, title, domain)
+        self._current: Tuple[Optional[str], Optional[str], Optional[str]] = (None, None, None)
+        self.app_start_time = None
+        
+        # Last looked up window as (hwnd, pid, app name, lowercased app
+        # name), and process names by pid as (create time, name)
+        self._last_window = None
+        self._process_names: Dict[int, Tuple[float, str]] = {}
+        
+        # Track idle state
+        self.idle_threshold = self.settings.get("idle_threshold_minutes", 5) * 60
+        self.poll_interval = self.settings.get("poll_interval_seconds", 5)
+        
+        # Input tracking for idle detection where the OS can't tell us
+        self.mouse_listener = None
+        self.keyboard_listener = None
+        if PYNPUT_SUPPORT:
+            self._setup_input_listeners()
+    
+    def _setup_input_listeners(self):
+        """Setup mouse and keyboard listeners for idle detection."""
+        if not PYNPUT_SUPPORT:
+            return
+        
+        def on_activity(*args):
+            self.last_activity_time = time.time()
+        
+        self.mouse_listener = mouse.Listener(
+            on_move=on_activity,
+            on_click=on_activity,
+            on_scroll=on_activity
+        )
+        
+        self.keyboard_listener = keyboard.Listener(
+            on_press=on_activity,
+            on_release=on_activity
+        )
+    
+    def _get_active_window_info(self) -> Dict[str, Optional[str]]:
+        """Get information about the currently active window."""
+        if not WINDOWS_SUPPORT:
+            return {"app": None, "title": None, "domain": None}
+        
+        return self._get_window_info(win32gui.GetForegroundWindow())
+    
+    def _get_window_info(self, hwnd) -> Dict[str, Optional[str]]:
+        """Get information about the given window."""
+        if not hwnd:
+            return {"app": None, "title": None, "domain": None}
+        
+        try:
+            # Get window title
+            window_title = win32gui.GetWindowText(hwnd)
+            
+            # Get process info, only querying the process when focus moved
+            # to a different window
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            if self._last_window and self._last_window[:2] == (hwnd, pid):
+                app_name, app_name_lc = self._last_window[2:]
+            else:
+                app_name = self._get_process_name(pid)
+                app_name_lc = app_name.lower()
+                self._last_window = (hwnd, pid, app_name, app_name_lc)
+            
+            # Try to extract domain from browser windows
+            domain = self._extract_domain_from_title(window_title, app_name_lc)
+            
+            return {
+                "app": app_name,
+                "title": window_title,
+                "domain": domain
+            }
+            
+        except Exception as e:
+            print(f"Error getting window info: {e}")
+            return {"app": None, "title": None, "domain": None}
+    
+    def _get_process_name(self, pid: int) -> str:
+        """Get the executable name of a process, cached by pid and start time."""
+        # psutil reads the create time when the Process is built, comparing it
+        # guards against a cached name for a recycled pid
+        process = psutil.Process(pid)
+        create_time = process.create_time()
+        
+        cached = self._process_names.get(pid)
+        if cached and cached[0] == create_time:
+            return cached[1]
+        
+        if len(self._process_names) >= self.PROCESS_NAME_CACHE_SIZE:
+            self._process_names.clear()
+        
+        name = process.name()
+        self._process_names[pid] = (create_time, name)
+        return name
+    
+    @staticmethod
+    def _extract_domain_from_title(title: str, app_name_lc: str) -> Optional[str]:
+        """Extract domain from browser window title, given the lowercased app name."""
+        if not title:
+            return None
+        
+        if app_name_lc not in BROWSERS:
+            return None
+        
+        # Every domain contains a dot, most titles can skip the regex
+        if "." not in title:
+            return None
+        
+        match = _URL_RE.search(title)
+        if match:
+            domain = match.group(1)
+        else:
+            match = _DOMAIN_RE.search(title)
+            if not match:
+                return None
+            domain = match.group(0)
+        
+        # Clean up the domain
+        domain = domain.strip().lower()
+        # Remove common prefixes
+        return _WWW_PREFIX.sub("", domain)
+    
+    def _log_app_change(self, new_app: str, new_title: str, new_domain: str,
+                        prev: Tuple[Optional[str], Optional[str], Optional[str]]):
+        """Log application/window change."""
+        current_time = time.time()
+        prev_app, prev_title, prev_domain = prev
+        
+        # Both entries of a switch are written together
+        with self.db.transaction():
+            # Log duration of previous app if it existed
+            if prev_app and self.app_start_time:
+                duration = int(current_time - self.app_start_time)
+                if duration > 0:
+                    self.db.log_activity(
+                        event_type="app_focus",
+                        application=prev_app,
+                        window_title=prev_title,
+                        website_domain=prev_domain,
+                        duration_seconds=duration
+                    )
+            
+            # Update current state
+            self._current = (new_app, new_title, new_domain)
+            self.app_start_time = current_time
+            
+            # Log website visit if domain changed and is present
+            if new_domain and new_domain != prev_domain:
+                self.db.log_activity(
+                    event_type="website_visit",
+                    application=new_app,
+                    website_domain=new_domain,
+                    metadata={"title": new_title}
+                )
+    
+    def _check_idle_state(self):
+        """Check if user is idle and log accordingly."""
+        current_time = time.time()
+        
+        if WINDOWS_SUPPORT:
+            idle_seconds = _get_idle_seconds()
+            if idle_seconds is not None:
+                self.last_activity_time = max(self.last_activity_time, current_time - idle_seconds)
+        
+        time_since_activity = current_time - self.last_activity_time
+        
+        if time_since_activity > self.idle_threshold:
+            # User is idle
+            self.db.log_activity(
+                event_type="idle",
+                duration_seconds=int(time_since_activity),
+                metadata={"idle_threshold_minutes": self.idle_threshold / 60}
+            )
+            
+            # Reset activity time to avoid repeated idle logs
+            self.last_activity_time = current_time
+    
+    def _update_window(self, window_info: Dict[str, Optional[str]]):
+        """Log a change if the active app, window or domain differs from the current one."""
+        new = (window_info["app"], window_info["title"], window_info["domain"])
+        
+        # Check if app/window changed
+        if new != self._current:
+            self._log_app_change(*new, prev=self._current)
+    
+    def _monitor_loop(self):
+        """Main monitoring loop."""
+        if WINDOWS_SUPPORT:
+            self._watch_window_events()
+        else:
+            self._idle_loop()
+    
+    def _idle_loop(self):
+        """Check the idle state until stop() is called.
+        
+        The active window can only be read on Windows, so elsewhere this is
+        all the logger does and it runs at half the idle threshold rather
+        than every poll interval.
+        """
+        print("Warning: window tracking is only supported on Windows, logging idle time only")
+        interval = max(self.poll_interval, self.idle_threshold / 2)
+        
+        while self.running:
+            try:
+                self._check_idle_state()
+            except Exception as e:
+                print(f"Error in activity monitoring: {e}")
+            
+            # Sleep until next check, waking early when stop() is called
+            if self._stop_event.wait(interval):
+                break
+    
+    def _watch_window_events(self):
+        """Track the active window from WinEvent hooks until stop() is called.
+        
+        Windows reports focus changes, and title changes of the focused
+        window such as switching browser tabs, through out-of-context hooks
+        that are delivered while this thread pumps its message queue. A
+        thread timer wakes the loop for idle checks, and stop() ends it by
+        posting WM_QUIT.
+        """
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+        user32.GetForegroundWindow.restype = wintypes.HWND
+        
+        @WinEventProc
+        def on_window_event(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+            if id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+                return
+            # Only title changes of the focused window matter
+            if event == EVENT_OBJECT_NAMECHANGE and hwnd != user32.GetForegroundWindow():
+                return
+            
+            try:
+                self._update_window(self._get_window_info(hwnd))
+            except Exception as e:
+                print(f"Error in activity monitoring: {e}")
+        
+        # Create this thread's message queue and publish its id before
+        # anything else, so stop() can post WM_QUIT to it from here on. A
+        # stop() that came earlier set _stop_event, which the loop checks
+        # before it first blocks.
+        msg = wintypes.MSG()
+        user32.PeekMessageW(ctypes.byref(msg), None, WM_USER, WM_USER, PM_NOREMOVE)
+        self._loop_thread_id = kernel32.GetCurrentThreadId()
+        
+        hooks = [
+            user32.SetWinEventHook(event, event, None, on_window_event, 0, 0, WINEVENT_OUTOFCONTEXT)
+            for event in (EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_NAMECHANGE)
+        ]
+        timer = user32.SetTimer(None, 0, self.IDLE_CHECK_INTERVAL * 1000, None)
+        
+        try:
+            # Pick up the window that had focus before the hooks were installed
+            self._update_window(self._get_active_window_info())
+            
+            while not self._stop_event.is_set() and user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_TIMER:
+                    try:
+                        self._check_idle_state()
+                    except Exception as e:
+                        print(f"Error in activity monitoring: {e}")
+                else:
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            self._loop_thread_id = None
+            user32.KillTimer(None, timer)
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+    
+    def start(self):
+        """Start activity logging."""
+        if self.running:
+            return
+        
+        self.running = True
+        self._stop_event.clear()
+        self.last_activity_time = time.time()
+        
+        # Start input listeners
+        if self.mouse_listener and self.keyboard_listener:
+            self.mouse_listener.start()
+            self.keyboard_listener.start()
+        
+        # Log system startup
+        self.db.log_system_event("session_start")
+        
+        # Start monitoring loop
+        self._monitor_loop()
+    
+    def stop(self):
+        """Stop activity logging."""
+        if not self.running:
+            return
+        
+        self.running = False
+        self._stop_event.set()
+        
+        # Wake the Windows message loop. Once it has published its thread id
+        # its queue exists, so the message is never lost, even if posted
+        # before GetMessageW blocks.
+        thread_id = self._loop_thread_id
+        if thread_id:
+            ctypes.windll.user32.PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
+        
+        # Log final app duration
+        app, title, domain = self._current
+        if app and self.app_start_time:
+            duration = int(time.time() - self.app_start_time)
+            if duration > 0:
+                self.db.log_activity(
+                    event_type="app_focus",
+                    application=app,
+                    window_title=title,
+                    website_domain=domain,
+                    duration_seconds=duration
+                )
+        
+        # Stop input listeners
+        if self.mouse_listener:
+            self.mouse_listener.stop()
+        if self.keyboard_listener:
+            self.keyboard_listener.stop()
+        
+        # Log system shutdown
+        self.db.log_system_event("session_end")
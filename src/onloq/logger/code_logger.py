@@ -0,0 +1,500 @@
+"""
+Code change logger for monitoring file changes and generating diffs
+"""
+
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Dict, Optional, Tuple
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import FileSystemEventHandler
+import sys
+
+try:
+    # C implementation of difflib's matcher, much faster on large files
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+    CDIFFLIB_SUPPORT = True
+except ImportError:
+    from difflib import SequenceMatcher
+    CDIFFLIB_SUPPORT = False
+
+from onloq.storage.database import Database
+from onloq.utils.config import Config
+
+def _digest(data: bytes) -> bytes:
+    """Get the digest used to tell whether file contents changed."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _hash_file(file_path: str) -> Optional[bytes]:
+    """Get the _digest of a file, reading it in chunks rather than all at once."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a line range for a unified diff hunk header."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+def _common_affix_lengths(a: List[str], b: List[str]) -> Tuple[int, int]:
+    """Count the lines a and b share at their start and, after those, at their end."""
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+def _get_opcodes(a: List[str], b: List[str]) -> List[Tuple[str, int, int, int, int]]:
+    """Get SequenceMatcher opcodes for a and b, only matching the lines between
+    their common prefix and suffix.
+    
+    Most saves change a small part of a file, this keeps the matcher from
+    indexing every unchanged line.
+    """
+    prefix, suffix = _common_affix_lengths(a, b)
+    a_stop, b_stop = len(a) - suffix, len(b) - suffix
+    
+    opcodes = [
+        (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in SequenceMatcher(None, a[prefix:a_stop], b[prefix:b_stop]).get_opcodes()
+    ]
+    if prefix:
+        opcodes.insert(0, ("equal", 0, prefix, 0, prefix))
+    if suffix:
+        opcodes.append(("equal", a_stop, len(a), b_stop, len(b)))
+    return opcodes
+
+def _group_opcodes(opcodes: List[Tuple[str, int, int, int, int]], n: int):
+    """Yield the change hunks of opcodes with n lines of context, like
+    SequenceMatcher.get_grouped_opcodes."""
+    if not opcodes:
+        return
+    
+    # Trim the leading and trailing unchanged lines down to context
+    tag, i1, i2, j1, j2 = opcodes[0]
+    if tag == "equal":
+        opcodes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    tag, i1, i2, j1, j2 = opcodes[-1]
+    if tag == "equal":
+        opcodes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+    
+    group = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        # Split hunks at unchanged runs longer than the context on both sides
+        if tag == "equal" and i2 - i1 > n * 2:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+def _unified_diff(a: List[str], b: List[str], fromfile: str, tofile: str, n: int = 3):
+    """Yield the lines of a unified diff like difflib.unified_diff(..., lineterm="").
+    
+    difflib's own function always uses its pure Python matcher, this one
+    picks up the C version when cdifflib is installed and skips the lines
+    both versions start and end with before matching.
+    """
+    started = False
+    for group in _group_opcodes(_get_opcodes(a, b), n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+        
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
+
+class CodeChangeHandler(FileSystemEventHandler):
+    # Number of recently changed files whose full text is kept for diffing
+    CONTENT_CACHE_SIZE = 64
+    
+    # Number of files whose content digest is kept, least recently seen
+    # files are forgotten first
+    MAX_CACHED_FILES = 10000
+    
+    def __init__(self, database: Database, config: Config):
+        self.db = database
+        self.config = config
+        self.file_extensions = config.get_file_extensions()
+        self.ignored_dirs = config.get_ignored_directories()
+        self.max_diff_bytes = config.get_max_diff_bytes()
+        
+        # Content digests of tracked files, to detect real changes
+        self.file_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        
+        # Previous text of recently changed files, for diff generation
+        self.content_cache: "OrderedDict[str, str]" = OrderedDict()
+        
+        # Debounce rapid file changes: path -> (latest change type, deadline).
+        # A single worker thread processes each path once it has been quiet
+        # for debounce_delay seconds.
+        self.change_queue: Dict[str, Tuple[str, float]] = {}
+        self.debounce_delay = 1.0  # 1 second
+        self._queue_cv = threading.Condition()
+        self._worker = None
+        self._closed = False
+    
+    def _should_track_file(self, file_path: str) -> bool:
+        """Check if a file should be tracked based on extension and location."""
+        # Check file extension
+        if not self.config.is_tracked_extension(file_path):
+            return False
+        
+        # Check if in ignored directory
+        return self.ignored_dirs.isdisjoint(Path(file_path).parts)
+    
+    def _read_file_bytes(self, file_path: str) -> Optional[bytes]:
+        """Safely read raw file content."""
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except Exception:
+            return None
+    
+    def _remember_digest(self, file_path: str, digest: bytes):
+        """Keep the content digest of a file to detect its next real change."""
+        self.file_cache[file_path] = digest
+        self.file_cache.move_to_end(file_path)
+        while len(self.file_cache) > self.MAX_CACHED_FILES:
+            self.file_cache.popitem(last=False)
+    
+    def _remember_content(self, file_path: str, content: str):
+        """Keep the text of a changed file as the base for its next diff."""
+        self.content_cache[file_path] = content
+        self.content_cache.move_to_end(file_path)
+        while len(self.content_cache) > self.CONTENT_CACHE_SIZE:
+            self.content_cache.popitem(last=False)
+    
+    @staticmethod
+    def _generate_diff(old_content: str, new_content: str, file_path: str) -> str:
+        """Generate unified diff between old and new content."""
+        if old_content is None:
+            old_content = ""
+        if new_content is None:
+            new_content = ""
+        
+        old_lines = old_content.splitlines()
+        new_lines = new_content.splitlines()
+        
+        diff = _unified_diff(
+            old_lines,
+            new_lines,
+            fromfile=f"a/{Path(file_path).name}",
+            tofile=f"b/{Path(file_path).name}"
+        )
+        
+        return "\n".join(diff)
+    
+    def _process_file_change(self, file_path: str, change_type: str):
+        """Process a file change event for a tracked file."""
+        try:
+            file_size = None
+            diff_content = None
+            # Set for files whose previous text is unknown (only their digest
+            # was cached at startup), logged without a diff
+            first_seen = False
+            
+            if change_type == "deleted":
+                # File was deleted, it is worth logging if it was tracked
+                tracked = self.file_cache.pop(file_path, None) is not None
+                old_content = self.content_cache.pop(file_path, None)
+                if old_content is not None:
+                    diff_content = self._generate_diff(old_content, "", file_path)
+                else:
+                    first_seen = tracked
+            
+            elif change_type in ["created", "modified"]:
+                # File was created or modified
+                if os.path.exists(file_path):
+                    file_size = os.path.getsize(file_path)
+                    
+                    if file_size > self.max_diff_bytes:
+                        # Too large to read and diff, just record the change
+                        diff_content = f"[diff skipped: file is {file_size} bytes]"
+                        self.file_cache.pop(file_path, None)
+                        self.content_cache.pop(file_path, None)
+                        data = None
+                    else:
+                        data = self._read_file_bytes(file_path)
+                    
+                    if data is not None:
+                        # Only generate diff if content actually changed
+                        digest = _digest(data)
+                        if self.file_cache.get(file_path) == digest:
+                            # Content didn't change, skip logging
+                            self.file_cache.move_to_end(file_path)
+                            return
+                        
+                        # Diff against the last text seen for this file. Files
+                        # without a digest are new and diffed from empty, a file
+                        # only hashed at startup has no text to diff against
+                        new_content = data.decode('utf-8', errors='ignore')
+                        old_content = self.content_cache.get(file_path)
+                        if old_content is None and file_path not in self.file_cache:
+                            old_content = ""
+                        if old_content is not None:
+                            diff_content = self._generate_diff(old_content, new_content, file_path)
+                        else:
+                            first_seen = True
+                        
+                        # Update cache
+                        self._remember_digest(file_path, digest)
+                        self._remember_content(file_path, new_content)
+            
+            # Log the change
+            if diff_content or first_seen:
+                relative_path = os.path.relpath(file_path)
+                metadata: Dict[str, Any] = {
+                    "absolute_path": file_path,
+                    "file_extension": Path(file_path).suffix
+                }
+                if first_seen:
+                    metadata["first_seen"] = True
+                self.db.log_code_change(
+                    file_path=relative_path,
+                    change_type=change_type,
+                    file_size=file_size,
+                    diff_content=diff_content,
+                    metadata=metadata
+                )
+                
+                print(f"📝 Logged {change_type}: {relative_path}")
+        
+        except Exception as e:
+            print(f"Error processing file change {file_path}: {e}")
+    
+    def _debounced_change(self, file_path: str, change_type: str):
+        """Handle debounced file changes to avoid rapid-fire events."""
+        # Drop untracked paths before they reach the debounce queue
+        if not self._should_track_file(file_path):
+            return
+        
+        with self._queue_cv:
+            if self._closed:
+                return
+            
+            # Keep the latest change type and push the deadline back
+            self.change_queue[file_path] = (change_type, time.monotonic() + self.debounce_delay)
+            
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._debounce_worker, daemon=True)
+                self._worker.start()
+            self._queue_cv.notify()
+    
+    def _next_due_changes(self) -> Optional[List[Tuple[str, str]]]:
+        """Wait for queued changes whose deadline has passed, or None once closed and drained."""
+        with self._queue_cv:
+            while True:
+                now = time.monotonic()
+                due = [
+                    (path, change_type)
+                    for path, (change_type, deadline) in self.change_queue.items()
+                    if self._closed or deadline <= now
+                ]
+                if due:
+                    for path, _ in due:
+                        del self.change_queue[path]
+                    return due
+                
+                if self._closed:
+                    return None
+                
+                # Sleep until the earliest deadline or the next queued change
+                timeout = None
+                if self.change_queue:
+                    timeout = min(deadline for _, deadline in self.change_queue.values()) - now
+                self._queue_cv.wait(timeout)
+    
+    def _debounce_worker(self):
+        """Process debounced file changes until the handler is stopped."""
+        while True:
+            due = self._next_due_changes()
+            if due is None:
+                return
+            for file_path, change_type in due:
+                self._process_file_change(file_path, change_type)
+    
+    def stop(self):
+        """Process pending changes right away and stop the debounce worker."""
+        with self._queue_cv:
+            self._closed = True
+            worker = self._worker
+            self._queue_cv.notify()
+        
+        if worker:
+            worker.join()
+        
+        # Allow the handler to be scheduled again after a restart
+        with self._queue_cv:
+            self._worker = None
+            self._closed = False
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._debounced_change(event.src_path, "created")
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._debounced_change(event.src_path, "modified")
+    
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._debounced_change(event.src_path, "deleted")
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            # Treat move as delete + create
+            self._debounced_change(event.src_path, "deleted")
+            self._debounced_change(event.dest_path, "created")
+
+class CodeLogger:
+    def __init__(self, database: Database, watch_directories: List[str] = None):
+        self.db = database
+        self.config = Config()
+        self.watch_dirs = watch_directories or self.config.get_watch_directories()
+        
+        # watchdog picks the native backend for the platform (inotify,
+        # FSEvents, kqueue or ReadDirectoryChangesW)
+        self.observer = Observer()
+        
+        self.event_handler = CodeChangeHandler(database, self.config)
+        self.running = False
+        self._stop_event = threading.Event()
+    
+    def _iter_tracked_files(self, root: str):
+        """Yield the tracked files below root, skipping ignored directories."""
+        ignored_dirs = self.event_handler.ignored_dirs
+        pending = [root]
+        
+        while pending:
+            try:
+                # scandir entries carry the file type, so no extra stat calls
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if entry.name not in ignored_dirs and not entry.is_symlink():
+                                pending.append(entry.path)
+                        elif self.event_handler._should_track_file(entry.path):
+                            yield entry.path
+            except OSError:
+                continue
+    
+    def _initialize_file_cache(self):
+        """Initialize file cache with existing files."""
+        print("🔍 Initializing file cache...")
+        
+        file_paths = []
+        for watch_dir in self.watch_dirs:
+            watch_path = Path(watch_dir).resolve()
+            
+            if not watch_path.exists():
+                print(f"⚠️  Watch directory does not exist: {watch_path}")
+                continue
+            
+            file_paths.extend(self._iter_tracked_files(str(watch_path)))
+        
+        # Hash existing files on a pool, file reads release the GIL so the
+        # threads overlap their disk waits
+        workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onloq-hash") as executor:
+            for file_path, digest in zip(file_paths, executor.map(_hash_file, file_paths)):
+                if digest is not None:
+                    self.event_handler._remember_digest(file_path, digest)
+        
+        cached_files = len(self.event_handler.file_cache)
+        print(f"📁 Cached {cached_files} files for change tracking")
+    
+    def start(self):
+        """Start code change monitoring."""
+        if self.running:
+            return
+        
+        # Polling would stat the whole tree every interval, refuse it rather
+        # than silently burning CPU on platforms without native events
+        if isinstance(self.observer, PollingObserver):
+            raise RuntimeError("No native file system event backend is available on this platform")
+        
+        self.running = True
+        self._stop_event.clear()
+        
+        # Initialize file cache
+        self._initialize_file_cache()
+        
+        # Setup watchers for each directory
+        for watch_dir in self.watch_dirs:
+            watch_path = Path(watch_dir).resolve()
+            
+            if watch_path.exists():
+                self.observer.schedule(
+                    self.event_handler,
+                    str(watch_path),
+                    recursive=True
+                )
+                print(f"👀 Watching: {watch_path}")
+            else:
+                print(f"⚠️  Directory not found: {watch_path}")
+        
+        # Start observer with error handling
+        try:
+            self.observer.start()
+        except OSError as e:
+            # e.g. the inotify watch limit was reached
+            raise RuntimeError(f"Failed to start file observer: {e}") from e
+        print("🚀 Code change monitoring started")
+        
+        # Block until stop() is called
+        try:
+            self._stop_event.wait()
+        except KeyboardInterrupt:
+            self.stop()
+    
+    def stop(self):
+        """Stop code change monitoring."""
+        if not self.running:
+            return
+        
+        self.running = False
+        self._stop_event.set()
+        
+        if self.observer.is_alive():
+            self.observer.stop()
+            self.observer.join()
+        
+        # No more events can arrive, flush the ones still being debounced
+        self.event_handler.stop()
+        
+        print("🛑 Code change monitoring stopped")
@@ -3,26 +3,39 @@ Daily scheduler for automatic summarization and notifications
 """
 
 import schedule
-import time
 import threading
 import datetime
 from pathlib import Path
 from typing import Optional
 
-from storage.database import Database
-from summarizer.llm_summarizer import LLMSummarizer
-from utils.config import Config
+from onloq.storage.database import Database
+from onloq.summarizer.llm_summarizer import LLMSummarizer, summary_filename
+from onloq.utils.config import Config
 from .notifier import Notifier
 
 
 class DailyScheduler:
-    def __init__(self, config: Config):
+    # Bounds in seconds on how long the scheduler thread sleeps between
+    # checks. The upper bound catches wall-clock jumps such as resuming from
+    # suspend, the lower one keeps a job that keeps failing from spinning.
+    MIN_WAIT = 1
+    MAX_WAIT = 60
+    
+    # Fewer active events than this in the last hour triggers a reminder
+    LOW_ACTIVITY_EVENTS = 3
+    
+    def __init__(self, config: Config, database: Optional[Database] = None):
         self.config = config
         self.settings = config.get_summarization_settings()
         self.running = False
         self.scheduler_thread = None
+        self._stop = threading.Event()
         self.notifier = Notifier()
         
+        # Database shared by all jobs, opened on first use unless given
+        self._db = database
+        self._owns_db = database is None
+        
         # Get schedule time from config
         self.summary_time = self.settings.get("summarize_time", "23:59")
         self.auto_summarize = self.settings.get("auto_summarize", False)
@@ -47,22 +60,30 @@ class DailyScheduler:
         print(f"📅 Scheduled daily summary at {self.summary_time}")
         print(f"🤖 Using model: {self.model}")
         
+    def _get_db(self) -> Database:
+        """Get the database used by scheduled jobs."""
+        if self._db is None:
+            self._db = Database(self.config.get_database_path())
+            self._db.initialize()
+        return self._db
+    
     def _generate_daily_summary(self):
         """Generate and save daily summary."""
         try:
             print("🤖 Generating daily summary...")
             
+            # Jobs run close to midnight, fix the date before generating
+            summary_date = datetime.date.today()
+            summary_file = summary_filename(summary_date)
+            
             # Initialize components
-            db = Database()
+            db = self._get_db()
             summarizer = LLMSummarizer(model=self.model)
             
             # Generate summary
-            summary = summarizer.generate_summary(db, days=1)
+            summary = summarizer.generate_summary(db, days=1, summary_date=summary_date)
             
             # Save to file
-            date_str = datetime.datetime.now().strftime("%Y-%m-%d")
-            summary_file = f"daily_summary_{date_str}.md"
-            
             with open(summary_file, 'w', encoding='utf-8') as f:
                 f.write(summary)
             
@@ -84,21 +105,14 @@ class DailyScheduler:
     def _check_activity_reminder(self):
         """Check if user needs activity reminders."""
         try:
-            db = Database()
-            
             # Get activity from last hour
-            from datetime import datetime, timedelta
-            one_hour_ago = datetime.now() - timedelta(hours=1)
-            
-            cursor = db.conn.execute("""
-                SELECT COUNT(*) FROM activity_logs 
-                WHERE timestamp >= ? AND event_type != 'idle'
-            """, (one_hour_ago,))
-            
-            activity_count = cursor.fetchone()[0]
+            one_hour_ago = datetime.datetime.now() - datetime.timedelta(hours=1)
+            activity_count = self._get_db().count_active_events(
+                one_hour_ago, limit=self.LOW_ACTIVITY_EVENTS
+            )
             
             # If very low activity, send reminder
-            if activity_count < 3:
+            if activity_count < self.LOW_ACTIVITY_EVENTS:
                 self.notifier.send_activity_reminder()
                 
         except Exception as e:
@@ -108,13 +122,17 @@ class DailyScheduler:
         """Main scheduler loop."""
         print("🕐 Daily scheduler started")
         
-        while self.running:
+        while not self._stop.is_set():
             try:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
             except Exception as e:
                 print(f"❌ Scheduler error: {e}")
-                time.sleep(60)
+            
+            # Sleep until the next job is due or stop() is called
+            delay = schedule.idle_seconds()
+            if delay is None:
+                delay = self.MAX_WAIT
+            self._stop.wait(timeout=min(max(delay, self.MIN_WAIT), self.MAX_WAIT))
         
         print("🛑 Daily scheduler stopped")
     
@@ -129,6 +147,7 @@ class DailyScheduler:
             return
         
         self.running = True
+        self._stop.clear()
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
@@ -141,11 +160,17 @@ class DailyScheduler:
             return
         
         self.running = False
+        self._stop.set()
         schedule.clear()
         
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=5)
         
+        # Close the connection if the scheduler opened it itself
+        if self._owns_db and self._db:
+            self._db.close()
+            self._db = None
+        
         print("📅 Daily scheduler stopped")
     
     def force_summary(self):
@@ -168,15 +193,12 @@ class DailyScheduler:
         self.summary_time = new_time
         
         # Update config
-        summarization_settings = self.config.get_summarization_settings()
-        summarization_settings["summarize_time"] = new_time
-        self.config.config["summarization"] = summarization_settings
-        self.config._save_config()
+        self.config.update_summarization_settings(summarize_time=new_time)
+        self.config.save()
         
         # Restart scheduler with new time
         if self.running:
             self.stop()
-            time.sleep(1)
             self.start()
         
         print(f"📅 Updated summary time to: {new_time}")
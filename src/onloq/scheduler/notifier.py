@@ -5,26 +5,69 @@ Cross-platform notification system for Onloq
 import os
 import platform
 import subprocess
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Tuple
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+try:
+    # WinRT bindings, shows toasts in-process instead of through PowerShell
+    from winsdk.windows.data.xml.dom import XmlDocument
+    from winsdk.windows.ui.notifications import ToastNotification, ToastNotificationManager
+    WINSDK_SUPPORT = True
+except ImportError:
+    WINSDK_SUPPORT = False
+
+# Toasts need a registered app id, Onloq isn't installed as an app so it
+# borrows PowerShell's
+TOAST_APP_ID = "{1AC14E77-02E7-4E5D-B744-2EB1AE5198B7}\\WindowsPowerShell\\v1.0\\powershell.exe"
+
+# Balloon icons the PowerShell fallback accepts
+BALLOON_ICONS = {"info": "Info", "warning": "Warning", "error": "Error"}
 
 
 class Notifier:
+    # Repeats of a notification within this many seconds are not shown
+    DEDUP_WINDOW = 10.0
+    
     def __init__(self):
         self.system = platform.system().lower()
         self.enabled = True
+        self._toast_notifier = None
         
+        # Monotonic time each recent (title, message) was shown
+        self._recent: Dict[Tuple[str, str], float] = {}
+    
+    def _show_windows_toast(self, title: str, message: str):
+        """Show a toast notification on Windows through WinRT."""
+        if self._toast_notifier is None:
+            self._toast_notifier = ToastNotificationManager.create_toast_notifier(TOAST_APP_ID)
+        
+        xml = XmlDocument()
+        xml.load_xml(
+            '<toast><visual><binding template="ToastGeneric">'
+            f'<text>{escape(title)}</text><text>{escape(message)}</text>'
+            '</binding></visual></toast>'
+        )
+        self._toast_notifier.show(ToastNotification(xml))
+    
     def _show_windows_notification(self, title: str, message: str, icon: str = "info"):
-        """Show notification on Windows using PowerShell."""
+        """Show notification on Windows, in-process with winsdk or else using PowerShell."""
         try:
-            # Use PowerShell to show toast notification
+            if WINSDK_SUPPORT:
+                self._show_windows_toast(title, message)
+                return
+            
+            # Use PowerShell to show a balloon notification. The text is
+            # passed through the environment so it is never parsed as script.
+            icon_name = BALLOON_ICONS.get(icon, "Info")
             ps_script = f'''
 Add-Type -AssemblyName System.Windows.Forms
 $notification = New-Object System.Windows.Forms.NotifyIcon
-$notification.Icon = [System.Drawing.SystemIcons]::{icon.title()}
-$notification.BalloonTipIcon = [System.Windows.Forms.ToolTipIcon]::{icon.title()}
-$notification.BalloonTipText = "{message}"
-$notification.BalloonTipTitle = "{title}"
+$notification.Icon = [System.Drawing.SystemIcons]::{icon_name}
+$notification.BalloonTipIcon = [System.Windows.Forms.ToolTipIcon]::{icon_name}
+$notification.BalloonTipText = $env:ONLOQ_MESSAGE
+$notification.BalloonTipTitle = $env:ONLOQ_TITLE
 $notification.Visible = $true
 $notification.ShowBalloonTip(5000)
 Start-Sleep -Seconds 6
@@ -32,7 +75,8 @@ $notification.Dispose()
 '''
             subprocess.run([
                 "powershell", "-Command", ps_script
-            ], capture_output=True, text=True)
+            ], capture_output=True, text=True,
+                env={**os.environ, "ONLOQ_TITLE": title, "ONLOQ_MESSAGE": message})
             
         except Exception as e:
             print(f"⚠️ Windows notification failed: {e}")
@@ -70,6 +114,15 @@ $notification.Dispose()
         if not self.enabled:
             return
         
+        # Coalesce bursts of the same notification, e.g. one error reported
+        # by several components
+        now = time.monotonic()
+        key = (title, message)
+        if now - self._recent.get(key, float("-inf")) < self.DEDUP_WINDOW:
+            return
+        self._recent = {k: shown for k, shown in self._recent.items() if now - shown < self.DEDUP_WINDOW}
+        self._recent[key] = now
+        
         try:
             if self.system == "windows":
                 self._show_windows_notification(title, message, icon)
@@ -86,12 +139,14 @@ $notification.Dispose()
     
     def send_daily_summary_notification(self, summary_file: str, stats: Dict[str, Any]):
         """Send notification when daily summary is ready."""
-        active_time = stats.get('active_time', 'Unknown')
-        apps_count = stats.get('apps_today', 0)
-        files_count = stats.get('files_today', 0)
-        
-        title = "📊 Daily Summary Ready!"
-        message = f"""Your development journal is ready!
+        # Only build the message when it will be shown
+        if self.enabled:
+            active_time = stats.get('active_time', 'Unknown')
+            apps_count = stats.get('apps_today', 0)
+            files_count = stats.get('files_today', 0)
+            
+            title = "📊 Daily Summary Ready!"
+            message = f"""Your development journal is ready!
         
 📁 File: {summary_file}
 ⏱️ Active time: {active_time}
@@ -99,14 +154,17 @@ $notification.Dispose()
 📝 Files changed: {files_count}
 
 Click to open the summary file."""
-        
-        self.send_notification(title, message, "info")
+            
+            self.send_notification(title, message, "info")
         
         # Also try to open the file
         self._try_open_file(summary_file)
     
     def send_startup_notification(self, schedule_time: str):
         """Send notification when Onloq starts with auto-summary enabled."""
+        if not self.enabled:
+            return
+        
         title = "🚀 Onloq Started"
         message = f"Privacy-first activity logging started!\nDaily summary scheduled for {schedule_time}"
         
@@ -114,6 +172,9 @@ Click to open the summary file."""
     
     def send_error_notification(self, error_message: str):
         """Send error notification."""
+        if not self.enabled:
+            return
+        
         title = "❌ Onloq Error"
         message = f"Something went wrong:\n{error_message}"
         
@@ -121,6 +182,9 @@ Click to open the summary file."""
     
     def send_activity_reminder(self):
         """Send reminder about low activity."""
+        if not self.enabled:
+            return
+        
         title = "💡 Activity Reminder"
         message = "Low activity detected. Take a break or consider logging more detailed work!"
         
@@ -128,6 +192,9 @@ Click to open the summary file."""
     
     def send_week_summary_notification(self):
         """Send notification for weekly summary."""
+        if not self.enabled:
+            return
+        
         title = "📈 Weekly Summary Available"
         message = "Your weekly development summary is ready for review!"
         
@@ -0,0 +1,595 @@
+"""
+SQLite database management for Onloq
+"""
+
+import sqlite3
+import atexit
+import contextlib
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+from onloq.utils.config import Config
+
+try:
+    # C JSON encoder, several times faster than the json module
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+def _dumps_metadata(metadata: Dict) -> str:
+    """Serialize event metadata for the metadata TEXT columns."""
+    if ORJSON_SUPPORT:
+        return orjson.dumps(metadata).decode("utf-8")
+    return json.dumps(metadata)
+
+# Insert statements used by the batch writer, keyed by table name
+_INSERT_SQL = {
+    "activity_logs": """
+        INSERT INTO activity_logs 
+        (timestamp, event_type, application, window_title, website_domain, duration_seconds, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+    "code_logs": """
+        INSERT INTO code_logs 
+        (timestamp, file_path, change_type, file_size, diff_content, metadata)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+    "system_events": """
+        INSERT INTO system_events 
+        (timestamp, event_type, metadata)
+        VALUES (?, ?, ?)
+    """,
+}
+
+# Queued by flush() to make the writer commit what it has right away, and by
+# close() to make it exit
+_FLUSH = object()
+_STOP = object()
+
+class Database:
+    # Schema version kept in PRAGMA user_version, see _migrate
+    SCHEMA_VERSION = 1
+    
+    # Batch writer thresholds: pending rows are committed together once
+    # BUFFER_SIZE rows have queued up or FLUSH_INTERVAL seconds have passed.
+    BUFFER_SIZE = 200
+    FLUSH_INTERVAL = 2.0
+    
+    # Rows read from SQLite at a time by the get_*_logs iterators
+    FETCH_SIZE = 256
+    
+    # Connection tuning applied once per open. WAL with synchronous=NORMAL
+    # only syncs at checkpoints instead of on every commit.
+    PRAGMAS = (
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("temp_store", "MEMORY"),
+        ("cache_size", -65536),  # 64 MiB
+        ("mmap_size", 268435456),  # 256 MiB
+        ("wal_autocheckpoint", 1000),
+        ("foreign_keys", "ON"),
+    )
+    
+    def __init__(self, db_path: str = None):
+        # Only consult (and create) the config file when no path is given
+        self.db_path = db_path or Config().get_database_path()
+        self.conn = None
+        self._write_cursor = None
+        
+        # Background batch writer state
+        self._queue = queue.Queue()
+        self._lock = threading.RLock()
+        self._writer_thread = None
+        
+        # Rows logged inside transaction(), per thread
+        self._transaction = threading.local()
+        
+    def initialize(self):
+        """Initialize database and create tables."""
+        # Room for every statement this class runs, so none are re-prepared
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        # Rows support both index and column name access
+        self.conn.row_factory = sqlite3.Row
+        self._apply_pragmas()
+        
+        # Create tables
+        self._create_tables()
+        self._migrate()
+        
+        # Dedicated cursor for the batch writer, so inserts reuse the
+        # prepared statements held in the connection's statement cache
+        self._write_cursor = self.conn.cursor()
+        
+        # Start background writer
+        self._start_writer()
+        
+        # Don't lose queued rows if the process exits without close()
+        atexit.register(self.close)
+    
+    def _apply_pragmas(self):
+        """Apply connection-level PRAGMA settings."""
+        for name, value in self.PRAGMAS:
+            self.conn.execute(f"PRAGMA {name} = {value}")
+    
+    def _create_tables(self):
+        """Create database tables."""
+        
+        # Activity logs table
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS activity_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),  -- Unix time
+                event_type TEXT NOT NULL,  -- 'app_focus', 'website_visit', 'system_event', 'idle'
+                application TEXT,
+                window_title TEXT,
+                website_domain TEXT,
+                duration_seconds INTEGER DEFAULT 0,
+                metadata TEXT  -- JSON for additional data
+            )
+        """)
+        
+        # Code change logs table
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS code_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),  -- Unix time
+                file_path TEXT NOT NULL,
+                change_type TEXT NOT NULL,  -- 'created', 'modified', 'deleted'
+                file_size INTEGER,
+                diff_content TEXT,  -- unified diff
+                metadata TEXT  -- JSON for additional data
+            )
+        """)
+        
+        # System events table
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS system_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),  -- Unix time
+                event_type TEXT NOT NULL,  -- 'login', 'logout', 'sleep', 'wake', 'network_on', 'network_off'
+                metadata TEXT  -- JSON for additional data
+            )
+        """)
+        
+        # Create indexes for better performance. The activity and code
+        # indexes cover every column get_recent_stats and
+        # count_active_events read, so those are answered from the index alone.
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_activity_time_covering ON activity_logs
+            (timestamp, event_type, application, website_domain, duration_seconds)
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_code_time_path ON code_logs(timestamp, file_path)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_code_path ON code_logs(file_path)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_system_timestamp ON system_events(timestamp)")
+        
+        # Indexes from earlier versions that the ones above make redundant
+        for index in ("idx_activity_timestamp", "idx_activity_type", "idx_code_timestamp",
+                      "idx_activity_day", "idx_code_day"):
+            self.conn.execute(f"DROP INDEX IF EXISTS {index}")
+        
+        self.conn.commit()
+        
+        # Gather planner statistics once, close() keeps them current
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+            self.conn.execute("ANALYZE")
+            self.conn.commit()
+    
+    def _migrate(self):
+        """Bring tables created by earlier versions up to SCHEMA_VERSION."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+        
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if version < 1:
+                    # Timestamps were UTC "YYYY-MM-DD HH:MM:SS" text, now
+                    # they are integer Unix times
+                    for table in ("activity_logs", "code_logs", "system_events"):
+                        self.conn.execute(f"""
+                            UPDATE {table} SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER)
+                            WHERE typeof(timestamp) = 'text'
+                        """)
+                
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+    
+    def _start_writer(self):
+        """Start the background thread that batches queued inserts."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+    
+    def _writer_loop(self):
+        """Drain the insert queue and write rows in batches until close()."""
+        stopping = False
+        while not stopping:
+            # Sleep until there is something to write
+            item = self._queue.get()
+            
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            if item is _FLUSH:
+                # Nothing pending to commit
+                self._queue.task_done()
+                continue
+            
+            # Collect more rows until the batch is full, the interval expires
+            # or someone is waiting on a flush
+            batch = [item]
+            markers = 0
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BUFFER_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _FLUSH:
+                    markers += 1
+                    break
+                if item is _STOP:
+                    markers += 1
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._write_batch(batch)
+            
+            # Release flush() and close() only once the rows before them are committed
+            for _ in range(markers):
+                self._queue.task_done()
+    
+    def _insert_batch(self, batch: List[Any]):
+        """Insert (table, row) pairs, and lists of them from transaction(), in a single transaction."""
+        rows_by_table = {}
+        for item in batch:
+            for table, row in (item if isinstance(item, list) else (item,)):
+                rows_by_table.setdefault(table, []).append(row)
+        
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table, rows in rows_by_table.items():
+                    self._write_cursor.executemany(_INSERT_SQL[table], rows)
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+    
+    def _write_batch(self, batch: List[Any]):
+        """Write a batch of queued rows in a single transaction."""
+        try:
+            self._insert_batch(batch)
+        except Exception as e:
+            print(f"Error writing log batch: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+    
+    def flush(self):
+        """Block until all queued log entries have been written."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            # Cut the writer's current batch short instead of waiting it out
+            self._queue.put(_FLUSH)
+        else:
+            # No writer running, drain the queue on the calling thread
+            batch = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _FLUSH or item is _STOP:
+                    self._queue.task_done()
+                else:
+                    batch.append(item)
+            if batch:
+                self._write_batch(batch)
+        
+        self._queue.join()
+    
+    @contextlib.contextmanager
+    def transaction(self):
+        """Write the entries this thread logs inside the block in one transaction.
+        
+        When the block exits they are queued as a single item, which the batch
+        writer commits as a whole. They are discarded if the block raises.
+        Nested blocks join the outermost one.
+        """
+        if not self.conn:
+            self.initialize()
+        
+        if getattr(self._transaction, "rows", None) is not None:
+            yield self
+            return
+        
+        rows = self._transaction.rows = []
+        try:
+            yield self
+        finally:
+            self._transaction.rows = None
+        
+        if rows:
+            self._queue.put_nowait(rows)
+    
+    def _enqueue(self, item: tuple):
+        """Queue a (table, row) pair for the batch writer, or for the open transaction."""
+        rows = getattr(self._transaction, "rows", None)
+        if rows is not None:
+            rows.append(item)
+        else:
+            self._queue.put_nowait(item)
+    
+    def log_activity(self, event_type: str, application: str = None, window_title: str = None, 
+                    website_domain: str = None, duration_seconds: int = 0, metadata: Dict = None):
+        """Log an activity event."""
+        if not self.conn:
+            self.initialize()
+        
+        metadata_json = _dumps_metadata(metadata) if metadata else None
+        
+        self._enqueue((
+            "activity_logs",
+            (int(time.time()), event_type, application, window_title, website_domain, duration_seconds,
+             metadata_json)
+        ))
+    
+    def log_code_change(self, file_path: str, change_type: str, file_size: int = None, 
+                       diff_content: str = None, metadata: Dict = None):
+        """Log a code change event."""
+        if not self.conn:
+            self.initialize()
+        
+        metadata_json = _dumps_metadata(metadata) if metadata else None
+        
+        self._enqueue((
+            "code_logs",
+            (int(time.time()), file_path, change_type, file_size, diff_content, metadata_json)
+        ))
+    
+    def log_activity_many(self, entries: Iterable[Dict[str, Any]]):
+        """Log several activity events in one transaction.
+        
+        Each entry is a dict of log_activity's keyword arguments.
+        """
+        with self.transaction():
+            for entry in entries:
+                self.log_activity(**entry)
+    
+    def log_code_change_many(self, entries: Iterable[Dict[str, Any]]):
+        """Log several code change events in one transaction.
+        
+        Each entry is a dict of log_code_change's keyword arguments.
+        """
+        with self.transaction():
+            for entry in entries:
+                self.log_code_change(**entry)
+    
+    def log_system_event(self, event_type: str, metadata: Dict = None):
+        """Log a system event."""
+        if not self.conn:
+            self.initialize()
+        
+        metadata_json = _dumps_metadata(metadata) if metadata else None
+        
+        self._enqueue(("system_events", (int(time.time()), event_type, metadata_json)))
+    
+    @contextlib.contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Open a read-only connection for long queries.
+        
+        In WAL mode it reads a consistent snapshot without waiting on, or
+        holding up, the batch writer on the shared connection. An in-memory
+        database can't be opened twice, so there the shared connection is
+        used while holding the lock.
+        """
+        if not self.conn:
+            self.initialize()
+        
+        if self.db_path == ":memory:":
+            with self._lock:
+                yield self.conn
+            return
+        
+        conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True,
+                               check_same_thread=False)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            yield conn
+        finally:
+            conn.close()
+    
+    def _iter_logs(self, table: str, days: int) -> Iterator[sqlite3.Row]:
+        """Query a log table for the specified number of days, yielding rows as they are read."""
+        if not self.conn:
+            self.initialize()
+        
+        self.flush()
+        since = int(time.time()) - days * 86400
+        
+        return self._read_rows(f"""
+            SELECT * FROM {table} 
+            WHERE timestamp >= ? 
+            ORDER BY timestamp DESC
+        """, (since,))
+    
+    def _read_rows(self, sql: str, params: tuple) -> Iterator[sqlite3.Row]:
+        """Run a query on a reader connection, yielding rows as they are fetched."""
+        if self.db_path == ":memory:":
+            # reader() holds the lock there, which must not stay held while
+            # this generator is suspended, or the writer can never commit
+            with self.reader() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            yield from rows
+            return
+        
+        with self.reader() as conn:
+            cursor = conn.execute(sql, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(self.FETCH_SIZE)
+                    if not rows:
+                        return
+                    yield from rows
+            finally:
+                cursor.close()
+    
+    def get_activity_logs(self, days: int = 1) -> Iterator[sqlite3.Row]:
+        """Iterate over activity logs for the specified number of days, newest first."""
+        return self._iter_logs("activity_logs", days)
+    
+    def get_code_logs(self, days: int = 1) -> Iterator[sqlite3.Row]:
+        """Iterate over code change logs for the specified number of days, newest first."""
+        return self._iter_logs("code_logs", days)
+    
+    def get_system_events(self, days: int = 1) -> Iterator[sqlite3.Row]:
+        """Iterate over system events for the specified number of days, newest first."""
+        return self._iter_logs("system_events", days)
+    
+    def get_daily_aggregates(self, days: int = 1) -> Dict[str, Any]:
+        """Get activity totals for the specified number of days, grouped by SQLite.
+        
+        Returns the number of activity events, (application, seconds) pairs
+        by time spent, the websites visited, the idle seconds and the
+        (event type, timestamp) of session starts and ends.
+        """
+        if not self.conn:
+            self.initialize()
+        
+        self.flush()
+        since = {"since": int(time.time()) - days * 86400}
+        
+        with self.reader() as conn:
+            event_count, idle_seconds = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(CASE WHEN event_type = 'idle' THEN duration_seconds END), 0)
+                FROM activity_logs
+                WHERE timestamp >= :since
+            """, since).fetchone()
+            
+            app_durations = conn.execute("""
+                SELECT COALESCE(application, 'Unknown'), SUM(COALESCE(duration_seconds, 0)) AS seconds
+                FROM activity_logs
+                WHERE timestamp >= :since AND event_type = 'app_focus'
+                GROUP BY 1
+                ORDER BY seconds DESC, 1
+            """, since).fetchall()
+            
+            websites = conn.execute("""
+                SELECT DISTINCT website_domain FROM activity_logs
+                WHERE timestamp >= :since AND event_type = 'website_visit' AND website_domain IS NOT NULL
+                ORDER BY website_domain
+            """, since).fetchall()
+            
+            session_events = conn.execute("""
+                SELECT event_type, timestamp FROM system_events
+                WHERE timestamp >= :since AND event_type IN ('session_start', 'session_end')
+                ORDER BY timestamp DESC
+            """, since).fetchall()
+        
+        return {
+            "event_count": event_count,
+            "app_durations": [tuple(row) for row in app_durations],
+            "websites": [row[0] for row in websites],
+            "idle_seconds": idle_seconds,
+            "session_events": [tuple(row) for row in session_events]
+        }
+    
+    def count_active_events(self, since: datetime, limit: Optional[int] = None) -> int:
+        """Count non-idle activity events logged since the given local time.
+        
+        With a limit, counting stops once that many events were found.
+        """
+        if not self.conn:
+            self.initialize()
+        
+        self.flush()
+        
+        with self._lock:
+            # A negative LIMIT means no limit in SQLite
+            cursor = self.conn.execute("""
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM activity_logs 
+                    WHERE timestamp >= ? AND event_type != 'idle'
+                    LIMIT ?
+                )
+            """, (int(since.timestamp()), -1 if limit is None else limit))
+            return cursor.fetchone()[0]
+    
+    def get_recent_stats(self) -> Dict[str, Any]:
+        """Get recent activity statistics."""
+        if not self.conn:
+            self.initialize()
+        
+        self.flush()
+        return self._compute_stats(datetime.now().date())
+    
+    def _compute_stats(self, today) -> Dict[str, Any]:
+        """Query the activity statistics for the given day."""
+        # All four figures come from one statement. A half-open range on the
+        # bare timestamp column lets both tables use their timestamp index,
+        # which DATE(timestamp) = ? would not.
+        day = {
+            "start": int(datetime.combine(today, datetime.min.time()).timestamp()),
+            "end": int(datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp())
+        }
+        with self._lock:
+            apps_today, websites_today, files_today, active_seconds = self.conn.execute("""
+                SELECT
+                    COUNT(DISTINCT CASE WHEN event_type = 'app_focus' THEN application END),
+                    COUNT(DISTINCT CASE WHEN event_type = 'website_visit' THEN website_domain END),
+                    (SELECT COUNT(DISTINCT file_path) FROM code_logs
+                     WHERE timestamp >= :start AND timestamp < :end),
+                    COALESCE(SUM(CASE WHEN event_type != 'idle' THEN duration_seconds END), 0)
+                FROM activity_logs
+                WHERE timestamp >= :start AND timestamp < :end
+            """, day).fetchone()
+        active_time = f"{active_seconds // 3600}h {(active_seconds % 3600) // 60}m"
+        
+        return {
+            "apps_today": apps_today,
+            "websites_today": websites_today,
+            "files_today": files_today,
+            "active_time": active_time
+        }
+    
+    def __enter__(self):
+        if not self.conn:
+            self.initialize()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Flush pending writes and close database connection."""
+        if self.conn:
+            atexit.unregister(self.close)
+            self.flush()
+            
+            if self._writer_thread:
+                self._queue.put(_STOP)
+                self._writer_thread.join()
+                self._writer_thread = None
+            
+            self._write_cursor.close()
+            self._write_cursor = None
+            # Refresh planner statistics where enough rows have changed
+            self.conn.execute("PRAGMA optimize")
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,322 @@
+"""
+LLM summarizer using Ollama for generating daily activity summaries
+"""
+
+import json
+import functools
+import urllib.request
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, Any, Mapping, Optional, Tuple
+
+from onloq.storage.database import Database
+
+OLLAMA_URL = "http://localhost:11434"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ollama_models() -> Optional[Tuple[str, ...]]:
+    """Return the names of installed Ollama models, or None if Ollama is unreachable."""
+    try:
+        with urllib.request.urlopen(f"{OLLAMA_URL}/api/tags", timeout=0.5) as response:
+            data = json.load(response)
+    except (OSError, ValueError):
+        return None
+    
+    return tuple(model.get("name", "") for model in data.get("models", []))
+
+
+def get_ollama_models() -> Optional[Tuple[str, ...]]:
+    """Get installed Ollama models, caching the result once Ollama responds.
+    
+    check_ollama_model refreshes the cache when a model is missing from it.
+    """
+    models = _get_ollama_models()
+    if models is None:
+        # Don't remember failures, Ollama may be started later
+        _get_ollama_models.cache_clear()
+    return models
+
+
+def check_ollama() -> bool:
+    """Check if the local Ollama server is running."""
+    return get_ollama_models() is not None
+
+
+def _model_installed(model: str, models: Tuple[str, ...]) -> bool:
+    """Check if a model is one of the installed models, ignoring case."""
+    # Ollama lists names with their tag and resolves an untagged name to
+    # its :latest tag
+    model = model.lower()
+    if ":" not in model:
+        model += ":latest"
+    return any(model == name.lower() for name in models)
+
+
+def check_ollama_model(model: str) -> bool:
+    """Check if the local Ollama server is running and has the model installed."""
+    models = get_ollama_models()
+    if models is not None and not _model_installed(model, models):
+        # The cached list may predate an `ollama pull`, ask Ollama again
+        _get_ollama_models.cache_clear()
+        models = get_ollama_models()
+    return models is not None and _model_installed(model, models)
+
+
+def summary_filename(summary_date: date) -> str:
+    """Get the default file name for the summary of the given day."""
+    return f"daily_summary_{summary_date.isoformat()}.md"
+
+
+# Summary prompt, filled in by LLMSummarizer._create_prompt
+_PROMPT_TMPL = """You are a helpful assistant. Here is a developer's system usage and code change log for {date_range}.
+
+Summarize it concisely as a developer journal. Focus on major applications used, important coding activities, and anything notable.
+
+{activity}
+
+{code}
+
+Please provide a clean Markdown summary with bullet points for major insights. Be concise but informative.
+Focus on:
+- Key applications and time spent
+- Major coding projects or files worked on
+- Development patterns or productivity insights
+- Any notable activities or events
+
+Keep the summary under 500 words and format it as a daily development journal entry."""
+
+
+def _format_timestamp(timestamp: int) -> str:
+    """Format a stored Unix timestamp as local time for the prompt."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _count_changed_lines(diff_content: str) -> int:
+    """Count the lines starting with + or -, other than +++ and --- file headers, in a diff."""
+    # str.count scans in C, lines are found by the newline before them and
+    # the first line is checked on its own
+    added = diff_content.count("\n+") - diff_content.count("\n+++")
+    removed = diff_content.count("\n-") - diff_content.count("\n---")
+    first_line = diff_content[:1] in ("+", "-") and not diff_content.startswith(("+++", "---"))
+    return added + removed + first_line
+
+
+class LLMSummarizer:
+    # How long Ollama keeps the model loaded after a request, so summaries
+    # generated close together don't reload it
+    KEEP_ALIVE = "30m"
+    
+    def __init__(self, model: str = "qwen2.5"):
+        self.model = model
+        
+    def _check_ollama_availability(self) -> bool:
+        """Check if Ollama is available and the model is installed."""
+        return check_ollama_model(self.model)
+    
+    def _format_activity_data(self, aggregates: Dict[str, Any]) -> str:
+        """Format activity totals from Database.get_daily_aggregates for LLM prompt."""
+        if not aggregates["event_count"]:
+            return "No activity data recorded."
+        
+        # Format the data
+        parts = ["## Application Usage:\n"]
+        
+        # Apps come sorted by duration (most used first)
+        for app, duration_seconds in aggregates["app_durations"]:
+            hours = duration_seconds // 3600
+            minutes = (duration_seconds % 3600) // 60
+            
+            if hours > 0:
+                time_str = f"{hours}h {minutes}m"
+            else:
+                time_str = f"{minutes}m"
+            
+            parts.append(f"- {app}: {time_str}\n")
+        
+        if aggregates["websites"]:
+            parts.append("\n## Websites Visited:\n")
+            for domain in aggregates["websites"]:
+                parts.append(f"- {domain}\n")
+        
+        idle_time = aggregates["idle_seconds"]
+        if idle_time > 0:
+            idle_hours = idle_time // 3600
+            idle_minutes = (idle_time % 3600) // 60
+            parts.append(f"\n## Idle Time: {idle_hours}h {idle_minutes}m\n")
+        
+        if aggregates["session_events"]:
+            parts.append("\n## System Events:\n")
+            for event_type, timestamp in aggregates["session_events"]:
+                parts.append(f"- {event_type} at {_format_timestamp(timestamp)}\n")
+        
+        return "".join(parts)
+    
+    def _format_code_data(self, code_logs: Iterable[Mapping]) -> Tuple[str, int]:
+        """Format code change logs for LLM prompt, returning the text and the number of logs."""
+        # Group by file and change type
+        file_changes = {}
+        total_changes = 0
+        
+        for log in code_logs:
+            total_changes += 1
+            file_path = log['file_path'] or 'Unknown'
+            change_type = log['change_type'] or 'modified'
+            diff_content = log['diff_content'] or ''
+            
+            if file_path not in file_changes:
+                file_changes[file_path] = {
+                    'changes': [],
+                    'total_lines_changed': 0
+                }
+            
+            # Count lines changed (rough estimate from diff)
+            lines_changed = _count_changed_lines(diff_content)
+            
+            file_changes[file_path]['changes'].append({
+                'type': change_type,
+                'timestamp': _format_timestamp(log['timestamp']),
+                'lines_changed': lines_changed,
+                'diff_preview': diff_content[:200] + "..." if len(diff_content) > 200 else diff_content
+            })
+            
+            file_changes[file_path]['total_lines_changed'] += lines_changed
+        
+        if not total_changes:
+            return "No code changes recorded.", 0
+        
+        # Format the data
+        parts = [f"## Code Changes ({total_changes} total changes):\n"]
+        
+        # Sort files by number of lines changed
+        sorted_files = sorted(
+            file_changes.items(), 
+            key=lambda x: x[1]['total_lines_changed'], 
+            reverse=True
+        )
+        
+        for file_path, changes_data in sorted_files:
+            total_lines = changes_data['total_lines_changed']
+            num_changes = len(changes_data['changes'])
+            
+            parts.append(f"\n### {file_path} ({num_changes} changes, ~{total_lines} lines)\n")
+            
+            # Show recent changes (limit to avoid overwhelming the LLM)
+            recent_changes = changes_data['changes'][-3:]  # Last 3 changes
+            
+            for change in recent_changes:
+                parts.append(f"- {change['type']} at {change['timestamp']}\n")
+                if change['diff_preview'].strip():
+                    # Show a small preview of the diff
+                    preview_lines = change['diff_preview'].split('\n')[:3]
+                    for line in preview_lines:
+                        if line.strip():
+                            parts.append(f"  {line}\n")
+        
+        return "".join(parts), total_changes
+    
+    def _create_prompt(self, activity_data: str, code_data: str, days: int = 1) -> str:
+        """Create the prompt for the LLM."""
+        date_range = "today" if days == 1 else f"the past {days} days"
+        
+        return _PROMPT_TMPL.format(date_range=date_range, activity=activity_data, code=code_data)
+    
+    def _call_ollama(self, prompt: str) -> str:
+        """Call Ollama with the prompt and return the response."""
+        return "".join(self._stream_ollama(prompt)).strip()
+    
+    def _stream_ollama(self, prompt: str) -> Iterator[str]:
+        """Stream the response to the prompt from the Ollama HTTP API."""
+        request = urllib.request.Request(
+            f"{OLLAMA_URL}/api/generate",
+            data=json.dumps({
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "keep_alive": self.KEEP_ALIVE
+            }).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        
+        try:
+            with urllib.request.urlopen(request, timeout=120) as response:
+                # One JSON object per line, each carrying the next piece of text
+                for line in response:
+                    if not line.strip():
+                        continue
+                    
+                    data = json.loads(line)
+                    if "error" in data:
+                        raise Exception(f"Ollama error: {data['error']}")
+                    if data.get("response"):
+                        yield data["response"]
+                    if data.get("done"):
+                        break
+        except (OSError, ValueError) as e:
+            raise Exception(f"Error calling Ollama: {e}")
+    
+    def _prepare_summary(self, database: Database, days: int) -> Tuple[str, int, int]:
+        """Check Ollama and build the prompt, returning it with the activity and code log counts."""
+        
+        # Check if Ollama is available
+        if not self._check_ollama_availability():
+            raise Exception(f"Ollama is not available or model '{self.model}' is not installed. "
+                          f"Please install Ollama and run: ollama pull {self.model}")
+        
+        # Format data for LLM; activity is totalled by the database and code
+        # logs are read as they stream from it
+        aggregates = database.get_daily_aggregates(days=days)
+        activity_data = self._format_activity_data(aggregates)
+        activity_count = aggregates["event_count"]
+        code_data, code_count = self._format_code_data(database.get_code_logs(days=days))
+        
+        # Create prompt
+        prompt = self._create_prompt(activity_data, code_data, days)
+        
+        return prompt, activity_count, code_count
+    
+    def _summary_header(self, days: int, summary_date: Optional[date]) -> str:
+        """Get the metadata header placed above the summary."""
+        date_str = (summary_date or date.today()).isoformat()
+        
+        if days > 1:
+            return f"# Developer Journal - {days} Day Summary - {date_str}\n\n"
+        return f"# Developer Journal - {date_str}\n\n"
+    
+    def _summary_footer(self, activity_count: int, code_count: int) -> str:
+        """Get the data summary placed below the summary."""
+        return f"\n\n---\n*Generated from {activity_count} activity events and {code_count} code changes using {self.model}*\n"
+    
+    def generate_summary(self, database: Database, days: int = 1, summary_date: Optional[date] = None) -> str:
+        """Generate a summary of the specified number of days ending on summary_date (default today)."""
+        prompt, activity_count, code_count = self._prepare_summary(database, days)
+        
+        # Generate summary
+        summary = self._call_ollama(prompt)
+        
+        return self._summary_header(days, summary_date) + summary + self._summary_footer(activity_count, code_count)
+    
+    def stream_summary(self, database: Database, days: int = 1, summary_date: Optional[date] = None) -> Iterator[str]:
+        """Generate the same summary as generate_summary, yielding text as the model produces it.
+        
+        Ollama availability is checked and the logs are read before returning,
+        so those errors are raised here rather than on the first chunk.
+        """
+        prompt, activity_count, code_count = self._prepare_summary(database, days)
+        return self._stream_summary_chunks(prompt, days, summary_date, activity_count, code_count)
+    
+    def _stream_summary_chunks(self, prompt: str, days: int, summary_date: Optional[date],
+                               activity_count: int, code_count: int) -> Iterator[str]:
+        """Yield the header, the streamed model response and the footer."""
+        yield self._summary_header(days, summary_date)
+        
+        # Drop leading whitespace, as the stripped non-streaming response does
+        started = False
+        for chunk in self._stream_ollama(prompt):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            yield chunk
+        
+        yield self._summary_footer(activity_count, code_count)
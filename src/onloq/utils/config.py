@@ -0,0 +1,158 @@
+"""
+Configuration management for Onloq
+"""
+
+import atexit
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Any, FrozenSet
+
+try:
+    # C JSON encoder and decoder, several times faster than the json module
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+class Config:
+    # Defaults for a new config file, also used when a key is missing
+    DEFAULT_WATCH_DIRECTORIES = (".",)
+    DEFAULT_FILE_EXTENSIONS = (
+        ".py", ".js", ".ts", ".jsx", ".tsx", ".cpp", ".c", ".h", ".hpp",
+        ".java", ".kt", ".swift", ".go", ".rs", ".php", ".rb", ".cs",
+        ".html", ".css", ".scss", ".less", ".json", ".xml", ".yaml", ".yml",
+        ".sql", ".md", ".txt", ".sh", ".bat", ".ps1", ".dockerfile"
+    )
+    DEFAULT_IGNORED_DIRECTORIES = (
+        "__pycache__", ".git", ".svn", ".hg", "node_modules", ".vscode",
+        ".idea", "build", "dist", "target", "bin", "obj", ".pytest_cache",
+        ".mypy_cache", "venv", "env", ".env"
+    )
+    
+    def __init__(self, config_path: str = "./onloq_config.json"):
+        self.config_path = Path(config_path)
+        # Set by the setters, changes are only written by save()
+        self._dirty = False
+        self.config = self._load_or_create_default()
+        
+        # Checked for every file event, so kept as sets
+        self._file_extensions = frozenset(
+            ext.lower() for ext in self.config.get("file_extensions", self.DEFAULT_FILE_EXTENSIONS)
+        )
+        self._ignored_directories = frozenset(
+            self.config.get("ignored_directories", self.DEFAULT_IGNORED_DIRECTORIES)
+        )
+        
+        # Write unsaved changes if the process exits without calling save()
+        atexit.register(self.save)
+    
+    def _load_or_create_default(self) -> Dict[str, Any]:
+        """Load existing config or create default configuration."""
+        if self.config_path.exists():
+            try:
+                if ORJSON_SUPPORT:
+                    return orjson.loads(self.config_path.read_bytes())
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, IOError):
+                pass
+        
+        # Default configuration
+        default_config = {
+            "watch_directories": list(self.DEFAULT_WATCH_DIRECTORIES),
+            "file_extensions": list(self.DEFAULT_FILE_EXTENSIONS),
+            "ignored_directories": list(self.DEFAULT_IGNORED_DIRECTORIES),
+            "max_diff_bytes": 1048576,
+            "activity_tracking": {
+                "idle_threshold_minutes": 5,
+                "poll_interval_seconds": 5,
+                "track_websites": True,
+                "track_applications": True
+            },
+            "database": {
+                "path": "./onloq.db",
+                "encryption_enabled": False
+            },
+            "summarization": {
+                "default_model": "qwen2.5",
+                "auto_summarize": True,
+                "summarize_time": "23:59",
+                "periodic_reminders": False
+            }
+        }
+        
+        self._save_config(default_config)
+        return default_config
+    
+    def _save_config(self, config: Dict[str, Any] = None):
+        """Save configuration to file."""
+        config_to_save = config or self.config
+        
+        # Write a temporary file and swap it in, so the config is never left
+        # half written
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        if ORJSON_SUPPORT:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(config_to_save, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(config_to_save, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.config_path)
+    
+    def save(self, force: bool = False):
+        """Write the configuration to its file if it changed since the last save."""
+        if not (self._dirty or force):
+            return
+        
+        self._save_config()
+        self._dirty = False
+    
+    def get_watch_directories(self) -> List[str]:
+        """Get directories to watch for code changes."""
+        return self.config.get("watch_directories", list(self.DEFAULT_WATCH_DIRECTORIES))
+    
+    def set_watch_directories(self, directories: List[str]):
+        """Set directories to watch for code changes."""
+        if sorted(directories) == sorted(self.config.get("watch_directories", [])):
+            return
+        
+        self.config["watch_directories"] = directories
+        self._dirty = True
+    
+    def get_file_extensions(self) -> FrozenSet[str]:
+        """Get file extensions to track, lowercased."""
+        return self._file_extensions
+    
+    def is_tracked_extension(self, file_path: str) -> bool:
+        """Check if a file has one of the tracked extensions."""
+        return os.path.splitext(file_path)[1].lower() in self._file_extensions
+    
+    def get_ignored_directories(self) -> FrozenSet[str]:
+        """Get directories to ignore during file watching."""
+        return self._ignored_directories
+    
+    def get_max_diff_bytes(self) -> int:
+        """Get the size above which changed files are logged without a diff."""
+        return self.config.get("max_diff_bytes", 1048576)
+    
+    def get_database_path(self) -> str:
+        """Get database file path."""
+        return self.config.get("database", {}).get("path", "./onloq.db")
+    
+    def get_activity_settings(self) -> Dict[str, Any]:
+        """Get activity tracking settings."""
+        return self.config.get("activity_tracking", {})
+    
+    def get_summarization_settings(self) -> Dict[str, Any]:
+        """Get summarization settings."""
+        return self.config.get("summarization", {})
+    
+    def update_summarization_settings(self, **updates: Any):
+        """Update summarization settings."""
+        settings = self.config.setdefault("summarization", {})
+        if all(settings.get(key) == value for key, value in updates.items()):
+            return
+        
+        settings.update(updates)
+        self._dirty = True
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for Onloq tests
+"""
+
+import sys
+
+# Test runs are throwaway, don't write .pyc files for every imported module
+sys.dont_write_bytecode = True
+
+import pytest
+
+from onloq.storage.database import Database
+
+
+@pytest.fixture
+def fast_db(tmp_path):
+    """An on-disk database tuned for throwaway test data."""
+    db = Database(str(tmp_path / "test.db"))
+    # Applied after the regular PRAGMAS, so these win: no rollback journal,
+    # no fsync and no foreign key checks on every insert
+    db.PRAGMAS = Database.PRAGMAS + (
+        ("journal_mode", "OFF"),
+        ("synchronous", "OFF"),
+        ("foreign_keys", "OFF"),
+    )
+    db.initialize()
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """One in-memory database for the whole run, so the schema is created once."""
+    db = Database(":memory:")
+    db.initialize()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db(shared_db):
+    """The shared in-memory database, emptied again after each test."""
+    yield shared_db
+    # The writer commits every batch on this same connection, so a savepoint
+    # can't span the test; deleting the rows is just as cheap for these sizes
+    shared_db.flush()
+    with shared_db._lock, shared_db.conn:
+        for table in ("activity_logs", "code_logs", "system_events"):
+            shared_db.conn.execute(f"DELETE FROM {table}")
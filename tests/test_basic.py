@@ -2,50 +2,40 @@
 Basic tests for Onloq components
 """
 
+import importlib
+import io
+import json
 import pytest
-import tempfile
-import os
 from pathlib import Path
 
-# Add src to path for testing
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from onloq.storage.database import Database
+from onloq.utils.config import Config
+from watchdog.events import FileModifiedEvent
 
-from storage.database import Database
-from utils.config import Config
 
-
-def test_config_creation():
+def test_config_creation(tmp_path):
     """Test configuration creation and loading."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        config_path = f.name
+    config_path = str(tmp_path / "config.json")
+    config = Config(config_path)
     
-    try:
-        config = Config(config_path)
-        
-        # Test default values
-        assert config.get_watch_directories() == ["."]
-        assert ".py" in config.get_file_extensions()
-        assert "__pycache__" in config.get_ignored_directories()
-        
-        # Test setting watch directories
-        config.set_watch_directories(["/test/path"])
-        assert config.get_watch_directories() == ["/test/path"]
-        
-    finally:
-        if os.path.exists(config_path):
-            os.unlink(config_path)
+    # Test default values
+    assert config.get_watch_directories() == ["."]
+    assert ".py" in config.get_file_extensions()
+    assert "__pycache__" in config.get_ignored_directories()
+    
+    # Test setting watch directories
+    config.set_watch_directories(["/test/path"])
+    assert config.get_watch_directories() == ["/test/path"]
+    
+    # Changes are written on save
+    assert Config(config_path).get_watch_directories() == ["."]
+    config.save()
+    assert Config(config_path).get_watch_directories() == ["/test/path"]
 
 
-def test_database_initialization():
+def test_database_initialization(db):
     """Test database creation and basic operations."""
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-        db_path = f.name
-    
-    try:
-        db = Database(db_path)
-        db.initialize()
-        
+    with db.transaction():
         # Test logging activity
         db.log_activity(
             event_type="app_focus",
@@ -61,53 +51,201 @@ def test_database_initialization():
             file_size=100,
             diff_content="test diff"
         )
+    
+    # Test getting logs
+    activity_logs = list(db.get_activity_logs(days=1))
+    code_logs = list(db.get_code_logs(days=1))
+    
+    assert len(activity_logs) == 1
+    assert len(code_logs) == 1
+    assert activity_logs[0]['application'] == 'test_app'
+    assert code_logs[0]['file_path'] == 'test.py'
+    
+    # Test stats
+    stats = db.get_recent_stats()
+    assert isinstance(stats, dict)
+    assert 'apps_today' in stats
+
+
+def test_partly_read_logs_do_not_block_writes(db):
+    """Test that an unfinished log iterator doesn't hold up the writer."""
+    db.log_activity(event_type="app_focus", application="first")
+    db.log_activity(event_type="app_focus", application="second")
+    
+    logs = db.get_activity_logs(days=1)
+    next(logs)
+    
+    db.log_activity(event_type="app_focus", application="third")
+    assert db.get_recent_stats()["apps_today"] == 3
+
+
+@pytest.mark.parametrize("count", [1, 1000])
+def test_bulk_logging(db, count):
+    """Test that bulk logged entries are all written."""
+    db.log_activity_many(
+        {"event_type": "app_focus", "application": f"app_{i}"} for i in range(count)
+    )
+    db.log_code_change_many(
+        {"file_path": f"file_{i}.py", "change_type": "modified"} for i in range(count)
+    )
+    
+    assert sum(1 for _ in db.get_activity_logs(days=1)) == count
+    assert sum(1 for _ in db.get_code_logs(days=1)) == count
+
+
+@pytest.mark.slow
+def test_database_flushes_queued_writes_on_close(tmp_path):
+    """Test that queued log entries are written before the connection closes."""
+    db_path = str(tmp_path / "test.db")
+    db = Database(db_path)
+    db.initialize()
+    
+    for i in range(Database.BUFFER_SIZE + 50):
+        db.log_activity(event_type="app_focus", application=f"app_{i}")
+    db.close()
+    
+    db = Database(db_path)
+    assert sum(1 for _ in db.get_activity_logs(days=1)) == Database.BUFFER_SIZE + 50
+    db.close()
+
+
+def test_recent_stats_see_new_writes(fast_db):
+    """Test that status figures include rows written since the last call."""
+    fast_db.log_activity(event_type="app_focus", application="first")
+    assert fast_db.get_recent_stats()["apps_today"] == 1
+    
+    fast_db.log_activity(event_type="app_focus", application="second")
+    assert fast_db.get_recent_stats()["apps_today"] == 2
+
+
+def test_code_changes_are_debounced(tmp_path):
+    """Test that rapid events for one file are logged as a single change."""
+    from onloq.logger.code_logger import CodeChangeHandler
+    
+    config = Config(str(tmp_path / "config.json"))
+    source = str(tmp_path / "module.py")
+    
+    with Database(str(tmp_path / "test.db")) as db:
+        handler = CodeChangeHandler(db, config)
+        handler.debounce_delay = 0.05
         
-        # Test getting logs
-        activity_logs = db.get_activity_logs(days=1)
-        code_logs = db.get_code_logs(days=1)
-        
-        assert len(activity_logs) == 1
-        assert len(code_logs) == 1
-        assert activity_logs[0]['application'] == 'test_app'
-        assert code_logs[0]['file_path'] == 'test.py'
-        
-        # Test stats
-        stats = db.get_recent_stats()
-        assert isinstance(stats, dict)
-        assert 'apps_today' in stats
-        
-        db.close()
+        for i in range(5):
+            Path(source).write_text(f"value = {i}\n")
+            handler.on_modified(FileModifiedEvent(source))
+        handler.stop()
         
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        logs = list(db.get_code_logs(days=1))
+        assert len(logs) == 1
+        assert "+value = 4" in logs[0]["diff_content"]
 
 
-def test_cli_import():
-    """Test that CLI module can be imported."""
-    from cli.main import app
-    assert app is not None
+def test_first_edit_of_existing_file_has_no_diff(db, tmp_path):
+    """Test that a file only hashed at startup isn't logged as a whole-file add."""
+    from onloq.logger.code_logger import CodeChangeHandler, _hash_file
+    
+    config = Config(str(tmp_path / "config.json"))
+    source = str(tmp_path / "module.py")
+    Path(source).write_text("a = 1\n")
+    
+    handler = CodeChangeHandler(db, config)
+    handler._remember_digest(source, _hash_file(source))
+    
+    Path(source).write_text("a = 2\n")
+    handler._process_file_change(source, "modified")
+    Path(source).write_text("a = 3\n")
+    handler._process_file_change(source, "modified")
+    
+    first, second = sorted(db.get_code_logs(days=1), key=lambda log: log["id"])
+    assert first["diff_content"] is None
+    assert json.loads(first["metadata"])["first_seen"] is True
+    assert "-a = 2\n+a = 3" in second["diff_content"]
 
 
-def test_logger_imports():
-    """Test that logger modules can be imported."""
-    from logger.activity_logger import ActivityLogger
-    from logger.code_logger import CodeLogger
+def test_diff_of_small_edit_in_large_file():
+    """Test that a one line edit in a large file gives a single hunk with context."""
+    from onloq.logger.code_logger import CodeChangeHandler
     
-    assert ActivityLogger is not None
-    assert CodeLogger is not None
+    old_lines = [f"line {i}" for i in range(10000)]
+    new_lines = list(old_lines)
+    new_lines[5000] = "changed"
+    
+    diff = CodeChangeHandler._generate_diff("\n".join(old_lines), "\n".join(new_lines), "big.py")
+    assert diff.splitlines() == [
+        "--- a/big.py",
+        "+++ b/big.py",
+        "@@ -4998,7 +4998,7 @@",
+        " line 4997",
+        " line 4998",
+        " line 4999",
+        "-line 5000",
+        "+changed",
+        " line 5001",
+        " line 5002",
+        " line 5003",
+    ]
 
 
-def test_summarizer_import():
-    """Test that summarizer module can be imported."""
-    from summarizer.llm_summarizer import LLMSummarizer
-    
-    assert LLMSummarizer is not None
+@pytest.mark.parametrize("module", [
+    "onloq.cli.main",
+    "onloq.logger.activity_logger",
+    "onloq.logger.code_logger",
+    "onloq.summarizer.llm_summarizer",
+])
+def test_module_imports(module):
+    """Test that each application module can be imported."""
+    assert importlib.import_module(module) is not None
+
+
+def test_summarizer_initialization():
+    """Test that the summarizer keeps the model it was created with."""
+    from onloq.summarizer.llm_summarizer import LLMSummarizer
     
-    # Test summarizer initialization
     summarizer = LLMSummarizer("test_model")
     assert summarizer.model == "test_model"
 
 
+def test_domain_extraction_from_browser_titles():
+    """Test that website domains are picked out of browser window titles."""
+    from onloq.logger.activity_logger import ActivityLogger
+    
+    extract = ActivityLogger._extract_domain_from_title
+    
+    assert extract("Pull requests - https://www.github.com/onloq", "chrome.exe") == "github.com"
+    assert extract("Inbox - mail.google.com", "firefox.exe") == "mail.google.com"
+    assert extract("www.Example.org - Brave", "brave.exe") == "example.org"
+    assert extract("No domain here", "chrome.exe") is None
+    assert extract("Inbox - mail.google.com", "notepad.exe") is None
+    # A full URL takes precedence over a bare domain earlier in the title
+    assert extract("example.com - https://github.com", "chrome.exe") == "github.com"
+
+
+def test_ollama_model_check(monkeypatch):
+    """Test that models are matched by name and found once pulled, without a restart."""
+    from onloq.summarizer import llm_summarizer
+    
+    installed = ["llama3:latest"]
+    
+    def fake_urlopen(url, timeout):
+        return io.BytesIO(json.dumps({"models": [{"name": name} for name in installed]}).encode())
+    
+    monkeypatch.setattr(llm_summarizer.urllib.request, "urlopen", fake_urlopen)
+    llm_summarizer._get_ollama_models.cache_clear()
+    
+    assert llm_summarizer.check_ollama_model("llama3")
+    assert not llm_summarizer.check_ollama_model("qwen2.5")
+    
+    installed.append("qwen2.5:latest")
+    assert llm_summarizer.check_ollama_model("qwen2.5")
+    assert llm_summarizer.check_ollama_model("qwen2.5:latest")
+    
+    # Names have to match, not just appear in an installed model's name
+    installed.append("codellama3:7b")
+    assert not llm_summarizer.check_ollama_model("qwen")
+    assert not llm_summarizer.check_ollama_model("llama")
+    assert not llm_summarizer.check_ollama_model("codellama3")
+    assert llm_summarizer.check_ollama_model("codellama3:7b")
+    llm_summarizer._get_ollama_models.cache_clear()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
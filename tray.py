@@ -1,31 +1,101 @@
 from pystray import Icon, Menu, MenuItem
 from PIL import Image
+import mmap
 import os
-import subprocess
+import threading
+import time
+
+try:
+    # The logger service and its controls are Windows only (pywin32)
+    from onloq_service import start as _svc_start, stop as _svc_stop
+    SERVICE_SUPPORT = True
+except ImportError:
+    SERVICE_SUPPORT = False
+
+# Clicks on the same menu item closer together than this are treated as one
+CLICK_DEBOUNCE = 0.5
+_last_click = {}
+_click_lock = threading.Lock()
+
+def _run_in_background(action):
+    """Run a service control call off the tray thread so the menu stays responsive."""
+    now = time.monotonic()
+    with _click_lock:
+        last = _last_click.get(action)
+        if last is not None and now - last < CLICK_DEBOUNCE:
+            return
+        _last_click[action] = now
+    
+    def run():
+        try:
+            action()
+        except Exception as e:
+            print(f"Service control failed: {e}")
+    threading.Thread(target=run, daemon=True).start()
+
+# Tray icons are drawn at most this size, the source PNG is 1024x1024
+ICON_PATH = "icon.png"
+ICON_SIZE = 64
+# Decoded and scaled icon pixels, so later starts skip the PNG decode
+ICON_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "onloq", "icon.rgba")
+
+def load_icon_image():
+    """Load the tray icon, only decoding the PNG when it changed since it was cached."""
+    png = os.stat(ICON_PATH)
+    stamp = f"{ICON_SIZE}x{ICON_SIZE}:{png.st_size}:{png.st_mtime_ns}\n".encode()
+    
+    try:
+        with open(ICON_CACHE_PATH, 'rb') as f:
+            if f.readline() == stamp:
+                # Map the cached pixels instead of reading them, the image
+                # uses the page cache directly and keeps the mapping alive
+                pixels = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                return Image.frombuffer("RGBA", (ICON_SIZE, ICON_SIZE), memoryview(pixels)[len(stamp):],
+                                        "raw", "RGBA", 0, 1)
+    except (OSError, ValueError):
+        pass
+    
+    image = Image.open(ICON_PATH).convert("RGBA").resize((ICON_SIZE, ICON_SIZE), Image.LANCZOS)
+    try:
+        os.makedirs(os.path.dirname(ICON_CACHE_PATH), exist_ok=True)
+        with open(ICON_CACHE_PATH, 'wb') as f:
+            f.write(stamp + image.tobytes())
+    except OSError:
+        # e.g. a read-only home directory, just decode again next time
+        pass
+    return image
 
 # Function to start logger service
 def start_service(icon, item):
-    subprocess.Popen(['python', 'onloq_service.py', 'start'])
+    _run_in_background(_svc_start)
 
 # Function to stop logger service
 def stop_service(icon, item):
-    subprocess.Popen(['python', 'onloq_service.py', 'stop'])
+    _run_in_background(_svc_stop)
 
 # Function to exit
 def exit_action(icon, item):
+    # Ends the native event loop that icon.run() blocks in
     icon.stop()
 
 # Create menu
 menu = Menu(
-    MenuItem('Start Service', start_service),
-    MenuItem('Stop Service', stop_service),
+    MenuItem('Start Service', start_service, visible=SERVICE_SUPPORT),
+    MenuItem('Stop Service', stop_service, visible=SERVICE_SUPPORT),
     MenuItem('Exit', exit_action)
 )
 
-# Load an icon image
-icon_image = Image.open("icon.png")
+def main():
+    # Load an icon image
+    icon_image = load_icon_image()
+
+    # Create system tray icon
+    icon = Icon("Onloq Logger", icon_image, "Onloq Logger", menu)
 
-# Create system tray icon
-icon = Icon("Onloq Logger", icon_image, "Onloq Logger", menu)
+    # Block in the platform's own event loop (GetMessage on Windows, the
+    # GTK or AppKit main loop elsewhere) until exit_action stops it, so the
+    # tray wakes only for menu clicks. macOS requires this on the main thread.
+    icon.run()
 
-icon.run()
+if __name__ == "__main__":
+    main()